@@ -6,4 +6,13 @@ Factors Module - 因子实现
 # 这个文件用于因子模块的自动发现
 # 不需要显式导入，engine会自动发现factors目录下的所有因子
 
+import os
+import sys
+
+# 统一的路径引导: 各因子子包通过 src.* 导入基类与全局配置，
+# 只在包级别注册一次etf_factor根目录，子模块不再各自修改sys.path
+_etf_factor_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _etf_factor_root not in sys.path:
+    sys.path.insert(0, _etf_factor_root)
+
 __version__ = "1.0.0"
\ No newline at end of file
@@ -5,6 +5,7 @@ ANNUAL_VOL数据验证模块
 
 import pandas as pd
 import numpy as np
+import warnings
 
 # 使用绝对路径导入避免模块名冲突
 import importlib.util
@@ -52,7 +53,6 @@ class AnnualVolValidator:
         # 检查数据长度是否足够
         max_period = max(self.params['periods'])
         if len(data) < max_period + 1:  # 需要额外的数据计算收益率
-            import warnings
             warnings.warn(f"数据长度({len(data)})小于最大计算周期+1({max_period+1})，部分结果可能为空")
 
         # 检查收盘价数据
@@ -79,7 +79,6 @@ class AnnualVolValidator:
         # 检查连续性（不应有过多的空值）
         null_ratio = prices.isnull().sum() / len(prices)
         if null_ratio > 0.3:  # 30%以上为空值
-            import warnings
             warnings.warn(f"价格数据空值比例过高({null_ratio:.1%})，可能影响波动率计算准确性")
 
         # 检查价格序列的稳定性
@@ -88,7 +87,6 @@ class AnnualVolValidator:
             price_changes = non_null_prices.pct_change().dropna()
             extreme_changes = (price_changes.abs() > 0.5).sum()  # 50%以上变化
             if extreme_changes > len(price_changes) * 0.05:  # 5%以上的数据点有极端变化
-                import warnings
                 warnings.warn("检测到较多极端价格变化，可能影响波动率计算准确性")
 
     def _validate_date_data(self, dates: pd.Series) -> None:
@@ -172,13 +170,11 @@ class AnnualVolValidator:
             # 波动率的分布不应过于集中于零值附近
             zero_ratio = (non_null_vol < 0.01).sum() / len(non_null_vol)  # 1%以下的波动率
             if zero_ratio > 0.8:  # 80%以上接近零
-                import warnings
                 warnings.warn(f"周期{period}的年化波动率过于集中在低值区间，可能表示数据质量问题")
 
             # 检查异常高波动率的比例
             high_vol_ratio = (non_null_vol > 1.0).sum() / len(non_null_vol)  # 100%以上的年化波动率
             if high_vol_ratio > 0.2:  # 20%以上的数据点有高波动率
-                import warnings
                 warnings.warn(f"周期{period}的年化波动率中高波动率数据点较多({high_vol_ratio:.1%})，请检查数据质量")
 
         return True
\ No newline at end of file
@@ -55,6 +55,8 @@ class ATR(BaseFactor):
         lc = (low - prev_close).abs()
         tr_values = pd.concat([hl, hc, lc], axis=1).max(axis=1)
 
+        precision = config.get_precision('price')
+
         # 向量化计算所有周期的ATR
         for period in self.params["periods"]:
             column_name = f'ATR_{period}'
@@ -66,16 +68,16 @@ class ATR(BaseFactor):
             ).mean()
 
             # 应用全局精度配置
-            atr_values = atr_values.round(config.get_precision('price'))
+            atr_values = atr_values.round(precision)
 
             result[column_name] = atr_values
 
         # 数据验证和清理
+        # 全部ATR列作为一个float64块处理，无穷值与负值 (ATR应为正数) 以布尔掩码置NaN
         numeric_columns = [col for col in result.columns if col.startswith('ATR_')]
-        for col in numeric_columns:
-            result[col] = result[col].replace([float('inf'), -float('inf')], pd.NA)
-            # ATR应为正数
-            result[col] = result[col].where(result[col] >= 0)
+        block = result[numeric_columns].to_numpy(dtype=np.float64, copy=True)
+        block[np.isinf(block) | (block < 0)] = np.nan
+        result[numeric_columns] = block
 
         return result
 
@@ -5,6 +5,7 @@ ATR_PCT数据验证模块
 
 import pandas as pd
 import numpy as np
+import warnings
 
 # 使用绝对路径导入避免模块名冲突
 import importlib.util
@@ -52,7 +53,6 @@ class AtrPctValidator:
         # 检查数据长度是否足够
         max_period = max(self.params['periods'])
         if len(data) < max_period + 1:
-            import warnings
             warnings.warn(f"数据长度({len(data)})小于最大计算周期+1({max_period+1})，ATR_PCT结果可能不稳定")
 
         # 检查OHLC数据
@@ -84,7 +84,6 @@ class AtrPctValidator:
             # 检查连续性（不应有过多的空值）
             null_ratio = prices.isnull().sum() / len(prices)
             if null_ratio > 0.3:  # 30%以上为空值
-                import warnings
                 warnings.warn(f"{col}数据空值比例过高({null_ratio:.1%})，可能影响ATR_PCT计算准确性")
 
         # 检查OHLC逻辑关系
@@ -109,7 +108,6 @@ class AtrPctValidator:
         invalid_close_low = valid_data['hfq_close'] < valid_data['hfq_low']
 
         if invalid_close_high.any() or invalid_close_low.any():
-            import warnings
             warnings.warn("发现收盘价超出当日高低价范围的数据，可能影响ATR_PCT计算")
 
     def _validate_date_data(self, dates: pd.Series) -> None:
@@ -192,25 +190,21 @@ class AtrPctValidator:
             # 检查零值比例（如果ATR_PCT经常为0，可能表示价格无波动）
             zero_ratio = (non_null_atr_pct < 0.001).sum() / len(non_null_atr_pct)
             if zero_ratio > 0.5:  # 50%以上接近零值
-                import warnings
                 warnings.warn(f"周期{period}的ATR_PCT接近零值比例过高({zero_ratio:.1%})，可能表示价格波动性极低")
 
             # 检查ATR_PCT的平均水平
             atr_pct_mean = non_null_atr_pct.mean()
             if atr_pct_mean > 50:  # 平均ATR_PCT超过50%
-                import warnings
                 warnings.warn(f"周期{period}的ATR_PCT平均值过高({atr_pct_mean:.1f}%)，请检查数据质量")
 
             # 检查ATR_PCT的标准差
             atr_pct_std = non_null_atr_pct.std()
             if atr_pct_std > 20:  # 标准差超过20%
-                import warnings
                 warnings.warn(f"周期{period}的ATR_PCT标准差过大({atr_pct_std:.1f}%)，波动性异常")
 
             # 检查异常高ATR_PCT的比例
             high_atr_pct_ratio = (non_null_atr_pct > 20).sum() / len(non_null_atr_pct)  # 20%以上的ATR_PCT
             if high_atr_pct_ratio > 0.2:  # 20%以上的数据点有高ATR_PCT
-                import warnings
                 warnings.warn(f"周期{period}的ATR_PCT中高波动数据点较多({high_atr_pct_ratio:.1%})，请检查数据质量")
 
         return True
\ No newline at end of file
@@ -3,20 +3,7 @@ BOLL - 布林带因子模块
 Bollinger Bands - 波动率指标的模块化实现
 """
 
-# 使用绝对路径导入避免模块名冲突
-import os
-import sys
-import importlib.util
-
-# 直接使用绝对路径导入core模块
-current_dir = os.path.dirname(__file__)
-core_path = os.path.join(current_dir, 'core.py')
-
-spec = importlib.util.spec_from_file_location("boll_core", core_path)
-core_module = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(core_module)
-
-BOLL = core_module.BOLL
+from .core import BOLL
 
 # 保持向后兼容性
 __all__ = ['BOLL']
@@ -5,26 +5,11 @@ BOLL核心计算模块
 
 import pandas as pd
 import numpy as np
-import sys
-import os
-
-# 添加正确的项目路径
-etf_factor_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-sys.path.insert(0, etf_factor_root)
 
 from src.base_factor import BaseFactor
 from src.config import config
 
-# 使用绝对路径导入避免模块名冲突
-import importlib.util
-
-# 导入BollConfig
-current_dir = os.path.dirname(__file__)
-config_path = os.path.join(current_dir, 'config.py')
-spec = importlib.util.spec_from_file_location("boll_config", config_path)
-config_module = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(config_module)
-BollConfig = config_module.BollConfig
+from .config import BollConfig
 
 
 class BOLL(BaseFactor):
@@ -47,11 +32,11 @@ class BOLL(BaseFactor):
         period = self.params["period"]
         std_dev = self.params["std_dev"]
 
-        # 计算中轨 (移动平均)
-        mid = close.rolling(window=period, min_periods=1).mean()
-
-        # 计算标准差
-        std = close.rolling(window=period, min_periods=1).std()
+        # 计算中轨 (移动平均) 和标准差 - 共用同一个滚动窗口对象
+        # (pandas逐窗口增删更新，长序列价格大幅漂移时仍保持精度；±inf按缺失跳过)
+        rolling = close.rolling(window=period, min_periods=1)
+        mid = rolling.mean()
+        std = rolling.std()
 
         # 计算上下轨
         upper = mid + std_dev * std
@@ -63,9 +48,11 @@ class BOLL(BaseFactor):
         result['BOLL_MID'] = mid.round(precision)
         result['BOLL_LOWER'] = lower.round(precision)
 
-        # 数据清理
-        for col in ['BOLL_UPPER', 'BOLL_MID', 'BOLL_LOWER']:
-            result[col] = result[col].replace([float('inf'), -float('inf')], pd.NA)
+        # 数据清理: 三条轨道作为一个float64块，无穷值以布尔掩码置NaN
+        band_columns = ['BOLL_UPPER', 'BOLL_MID', 'BOLL_LOWER']
+        block = result[band_columns].to_numpy(dtype=np.float64, copy=True)
+        block[np.isinf(block)] = np.nan
+        result[band_columns] = block
 
         return result
 
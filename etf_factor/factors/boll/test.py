@@ -1,19 +1,13 @@
 """
 BOLL测试模块
 独立的测试和示例功能
+运行方式 (etf_factor目录下): python -m factors.boll.test
 """
 
 import pandas as pd
 import numpy as np
-import sys
-import os
-
-# 添加路径以导入因子
-current_dir = os.path.dirname(__file__)
-sys.path.insert(0, current_dir)
-
-from core import BOLL
-from validation import BollValidation
+from .core import BOLL
+from .validation import BollValidation
 
 
 def test_boll_basic():
@@ -108,6 +102,41 @@ def test_boll_edge_cases():
                       result_constant['BOLL_LOWER'].iloc[-1] == 10.0)
     print(f"   恒定价格检查: {'✅ 正确' if constant_check else '❌ 错误'} (三轨相等)")
 
+    # 测试含无穷值的收盘价：与pandas rolling一致按缺失跳过，只影响自身一行，不污染后续窗口
+    inf_close = 10 + 0.1 * np.sin(np.arange(300) * 0.2)
+    inf_close[100] = np.inf
+    inf_data = pd.DataFrame({
+        'ts_code': '510580.SH',
+        'trade_date': pd.date_range('2025-01-01', periods=300),
+        'hfq_close': inf_close
+    })
+    result_inf = factor.calculate_vectorized(inf_data)
+    expected_mid = pd.Series(inf_close).replace(np.inf, np.nan).rolling(20, min_periods=1).mean()
+    # 首行仅1个样本无标准差，其余行三轨均应有值
+    inf_check = (result_inf[['BOLL_UPPER', 'BOLL_MID', 'BOLL_LOWER']].iloc[1:].notna().all().all() and
+                 np.allclose(result_inf['BOLL_MID'], expected_mid, atol=1e-3))
+    print(f"   无穷值检查: {'✅ 正确' if inf_check else '❌ 错误'} (无穷值按缺失跳过)")
+
+    # 测试长序列大幅漂移的价格：与pandas rolling的均值/标准差逐行一致
+    n_long = 200_000
+    drift_close = np.linspace(1, 3000, n_long) * (1 + np.random.default_rng(9).normal(0, 0.01, n_long))
+    drift_data = pd.DataFrame({
+        'ts_code': '510580.SH',
+        'trade_date': pd.date_range('2000-01-01', periods=n_long),
+        'hfq_close': drift_close
+    })
+    result_drift = factor.calculate_vectorized(drift_data)
+    period, std_dev = factor.params['period'], factor.params['std_dev']
+    rolling = pd.Series(drift_close).rolling(period, min_periods=1)
+    expected_mid, expected_std = rolling.mean(), rolling.std()
+    # 输出按价格精度取整，允许取整误差 (累计和类算法在该数据上误差可达1e-4量级)
+    drift_check = all(
+        np.allclose(result_drift[col], expected, rtol=0, atol=1e-6, equal_nan=True)
+        for col, expected in (('BOLL_UPPER', expected_mid + std_dev * expected_std),
+                              ('BOLL_MID', expected_mid),
+                              ('BOLL_LOWER', expected_mid - std_dev * expected_std)))
+    print(f"   长序列漂移检查: {'✅ 正确' if drift_check else '❌ 错误'} (与pandas rolling逐行一致)")
+
     # 测试高波动数据
     high_vol_data = pd.DataFrame({
         'ts_code': ['510580.SH'] * 25,
@@ -5,26 +5,11 @@ CCI核心计算模块
 
 import pandas as pd
 import numpy as np
-import sys
-import os
-
-# 添加正确的项目路径
-etf_factor_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-sys.path.insert(0, etf_factor_root)
 
 from src.base_factor import BaseFactor
 from src.config import config
 
-# 使用绝对路径导入避免模块名冲突
-import importlib.util
-
-# 导入CciConfig
-current_dir = os.path.dirname(__file__)
-config_path = os.path.join(current_dir, 'config.py')
-spec = importlib.util.spec_from_file_location("cci_config", config_path)
-config_module = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(config_module)
-CciConfig = config_module.CciConfig
+from .config import CciConfig
 
 
 class CCI(BaseFactor):
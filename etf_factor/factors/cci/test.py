@@ -1,19 +1,13 @@
 """
 CCI测试模块
 独立的测试和示例功能
+运行方式 (etf_factor目录下): python -m factors.cci.test
 """
 
 import pandas as pd
 import numpy as np
-import sys
-import os
-
-# 添加路径以导入因子
-current_dir = os.path.dirname(__file__)
-sys.path.insert(0, current_dir)
-
-from core import CCI
-from validation import CciValidation
+from .core import CCI
+from .validation import CciValidation
 
 
 def test_cci_basic():
@@ -6,6 +6,8 @@ CCI验证模块
 import pandas as pd
 import numpy as np
 
+from src.bottleneck_compat import nanmean
+
 
 class CciValidation:
     """CCI因子验证工具"""
@@ -86,16 +88,17 @@ class CciValidation:
         period = params['period']
 
         if len(data) >= period:
-            recent_data = data.tail(period)
+            # 一次取出(period, 3)价格矩阵，后续均为NumPy归约
+            recent_prices = data[['hfq_high', 'hfq_low', 'hfq_close']].tail(period).to_numpy(dtype=np.float64)
 
             # 手工计算典型价格
-            manual_tp = (recent_data['hfq_high'] + recent_data['hfq_low'] + recent_data['hfq_close']) / 3
-            manual_ma = manual_tp.mean()
-            manual_md = np.abs(manual_tp - manual_ma).mean()
+            manual_tp = recent_prices.mean(axis=1)
+            manual_ma = nanmean(manual_tp)
+            manual_md = nanmean(np.abs(manual_tp - manual_ma))
 
             # 避免除零
             if manual_md > 0:
-                current_tp = manual_tp.iloc[-1]
+                current_tp = manual_tp[-1]
                 manual_cci = (current_tp - manual_ma) / (0.015 * manual_md)
 
                 cci_col = f'CCI_{period}'
@@ -4,34 +4,44 @@ CUM_RETURN核心计算模块
 """
 
 import pandas as pd
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+import numpy as np
 
 from src.base_factor import BaseFactor
 from src.config import config
-# 使用绝对路径导入避免模块名冲突
-import importlib.util
+from src.numba_compat import njit, prange, NUMBA_AVAILABLE
 
-# 导入CumReturnConfig
-current_dir = os.path.dirname(__file__)
-config_path = os.path.join(current_dir, 'config.py')
-spec = importlib.util.spec_from_file_location("cum_return_config", config_path)
-config_module = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(config_module)
-CumReturnConfig = config_module.CumReturnConfig
+from .config import CumReturnConfig
+from .validation import CumReturnValidator
 
-# 导入CumReturnValidator
-validation_path = os.path.join(current_dir, 'validation.py')
-spec = importlib.util.spec_from_file_location("cum_return_validation", validation_path)
-validation_module = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(validation_module)
-CumReturnValidator = validation_module.CumReturnValidator
+
+@njit(parallel=True, cache=True)
+def _cum_return_kernel(prices, periods, out):
+    """多周期累计收益率内核 - 按周期并行，单次遍历完成减、除、乘"""
+    for j in prange(periods.shape[0]):
+        period = periods[j]
+        for i in range(period, prices.shape[0]):
+            prev_price = prices[i - period]
+            if prev_price != 0:
+                out[i, j] = (prices[i] - prev_price) / prev_price * 100.0
+            else:
+                out[i, j] = np.nan
+
+
+# 精度与有效范围均为常量配置，导入时读取一次
+_PRECISION = config.get_precision('percentage')
+_RANGE_MIN, _RANGE_MAX = config.get_data_range('percentage')
+
+# 超过该行数的输入只抽样验证前_VALIDATION_SAMPLE_ROWS行
+_FULL_VALIDATION_MAX_ROWS = 100_000
+_VALIDATION_SAMPLE_ROWS = 1000
 
 
 class CUM_RETURN(BaseFactor):
     """累计收益率因子 - 模块化实现"""
 
+    # 计算前是否验证输入数据 (python -O 运行时始终跳过)，批量生产场景可在实例上关闭
+    strict_validate = True
+
     def __init__(self, params=None):
         """
         初始化CUM_RETURN因子
@@ -41,6 +51,8 @@ class CUM_RETURN(BaseFactor):
         validated_params = CumReturnConfig.validate_params(params)
         super().__init__(validated_params)
         self.validator = CumReturnValidator(self.params)
+        # 输出列名只依赖参数，初始化时生成一次
+        self._output_cols = tuple(CumReturnConfig.get_expected_output_columns(self.params))
 
     def calculate_vectorized(self, data: pd.DataFrame) -> pd.DataFrame:
         """
@@ -56,59 +68,88 @@ class CUM_RETURN(BaseFactor):
         Raises:
             ValueError: 当输入数据不符合要求时
         """
-        # 输入数据验证
-        self.validator.validate_input_data(data)
-
-        result = data[['ts_code', 'trade_date']].copy()
-
-        # 获取收盘价
-        close_prices = data['hfq_close']
-
-        # 计算各周期的累计收益率
-        for period in self.params["periods"]:
-            column_name = f'CUM_RETURN_{period}'
-
-            # 核心算法：计算累计收益率
-            cum_return = self._calculate_period_return(close_prices, period)
+        # 输入数据验证 (大数据量只抽样验证开头部分)
+        if __debug__ and self.strict_validate:
+            if len(data) > _FULL_VALIDATION_MAX_ROWS:
+                self.validator.validate_input_data(data.head(_VALIDATION_SAMPLE_ROWS))
+            else:
+                self.validator.validate_input_data(data)
+
+        # 获取收盘价 (底层float64数组，避免Series逐步运算的对齐开销)
+        close_prices = data['hfq_close'].to_numpy(dtype=np.float64)
+
+        # 核心算法：所有周期写入同一块(N, K)数组，一次分配
+        # 前period行无历史价格，保持NaN；基准价为0时产生的inf由_process_calculation_result统一清理
+        periods = np.asarray(self.params["periods"], dtype=np.int64)
+        cum_returns = np.full((len(close_prices), len(periods)), np.nan)
+        if NUMBA_AVAILABLE:
+            _cum_return_kernel(close_prices, periods, cum_returns)
+        else:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                for j, period in enumerate(periods):
+                    prev_prices = close_prices[:-period]
+                    cum_returns[period:, j] = (close_prices[period:] - prev_prices) / prev_prices * 100
+
+        # 数据处理：整块原地完成精度控制和异常值清理
+        self._process_calculation_result(cum_returns)
+
+        # 标识列引用输入列、各周期列引用结果数组，一次构建DataFrame而非逐列插入
+        columns = {'ts_code': data['ts_code'], 'trade_date': data['trade_date']}
+        for j, column_name in enumerate(self._output_cols):
+            columns[column_name] = cum_returns[:, j]
+
+        return pd.DataFrame(columns, copy=False)
+
+    def calculate_vectorized_multi(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        多标的批量计算累计收益率
+        按ts_code分组后组内shift，一次调用替代逐标的循环，标的之间不会串用价格
 
-            result[column_name] = cum_return
+        Args:
+            data: 包含多个ts_code的价格数据，各标的内部需按trade_date升序排列
 
-        return result
+        Returns:
+            包含累计收益率的DataFrame，行顺序与输入一致
+        """
+        if __debug__ and self.strict_validate:
+            if len(data) > _FULL_VALIDATION_MAX_ROWS:
+                self.validator.validate_input_data(data.head(_VALIDATION_SAMPLE_ROWS))
+            else:
+                self.validator.validate_input_data(data)
 
-    def _calculate_period_return(self, prices: pd.Series, period: int) -> pd.Series:
-        """计算指定周期的累计收益率"""
-        # 创建结果序列
-        cum_return = pd.Series(index=prices.index, dtype=float)
+        close_prices = data['hfq_close'].to_numpy(dtype=np.float64)
+        grouped_close = data.groupby('ts_code', sort=False, observed=True)['hfq_close']
 
-        # 从第period行开始计算（有足够历史数据的位置）
-        for i in range(period, len(prices)):
-            current_price = prices.iloc[i]
-            prev_price = prices.iloc[i - period]  # period天前的价格
+        periods = self.params["periods"]
+        cum_returns = np.empty((len(close_prices), len(periods)))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for j, period in enumerate(periods):
+                prev_prices = grouped_close.shift(period).to_numpy(dtype=np.float64)
+                cum_returns[:, j] = (close_prices - prev_prices) / prev_prices * 100
 
-            if pd.notna(current_price) and pd.notna(prev_price) and prev_price != 0:
-                return_value = ((current_price - prev_price) / prev_price) * 100
-                cum_return.iloc[i] = return_value
-            else:
-                cum_return.iloc[i] = pd.NA
+        self._process_calculation_result(cum_returns)
 
-        # 数据处理
-        cum_return = self._process_calculation_result(cum_return)
+        columns = {'ts_code': data['ts_code'], 'trade_date': data['trade_date']}
+        for j, column_name in enumerate(self._output_cols):
+            columns[column_name] = cum_returns[:, j]
 
-        return cum_return
+        return pd.DataFrame(columns, copy=False)
 
-    def _process_calculation_result(self, cum_return: pd.Series) -> pd.Series:
-        """处理计算结果，包括精度控制和异常值处理"""
+    def _process_calculation_result(self, cum_returns: np.ndarray) -> np.ndarray:
+        """处理计算结果，包括精度控制和异常值处理 (原地修改ndarray)"""
         # 应用精度配置
-        precision = config.get_precision('percentage')
-        cum_return = cum_return.round(precision)
+        np.round(cum_returns, _PRECISION, out=cum_returns)
 
         # 处理无穷大值
-        cum_return = cum_return.replace([float('inf'), -float('inf')], pd.NA)
+        cum_returns[np.isinf(cum_returns)] = np.nan
 
-        # 数据范围验证和修正
-        cum_return = config.validate_data_range(cum_return, 'percentage')
+        # 数据范围验证和修正 (超出范围的值设为NaN)
+        if _RANGE_MIN is not None:
+            cum_returns[cum_returns < _RANGE_MIN] = np.nan
+        if _RANGE_MAX is not None:
+            cum_returns[cum_returns > _RANGE_MAX] = np.nan
 
-        return cum_return
+        return cum_returns
 
     def get_required_columns(self) -> list:
         """获取计算所需的数据列"""
@@ -1,18 +1,13 @@
 """
 CUM_RETURN测试模块
 独立的测试和示例功能
+运行方式 (etf_factor目录下): python -m factors.cum_return.test
 """
 
 import pandas as pd
 import numpy as np
-import sys
-import os
 
-# 添加路径以导入因子
-current_dir = os.path.dirname(__file__)
-sys.path.insert(0, current_dir)
-
-from core import CUM_RETURN
+from .core import CUM_RETURN
 
 
 def create_test_data(length=25) -> pd.DataFrame:
@@ -23,10 +18,7 @@ def create_test_data(length=25) -> pd.DataFrame:
     trend = np.linspace(0, 0.2, length)  # 20%的总体上涨趋势
     noise = np.random.normal(0, 0.01, length)  # 1%的随机波动
 
-    prices = []
-    for i in range(length):
-        price = base_price * (1 + trend[i] + noise[i])
-        prices.append(max(price, 0.01))  # 确保价格为正
+    prices = np.maximum(base_price * (1 + trend + noise), 0.01)  # 确保价格为正
 
     return pd.DataFrame({
         'ts_code': ['510580.SH'] * length,
@@ -145,6 +137,33 @@ def test_cum_return_different_periods():
     print(f"   默认参数测试: {'✅ 通过' if has_default_cols else '❌ 失败'}")
 
 
+def test_cum_return_multi_symbol():
+    """多标的批量计算测试"""
+    print("\n🧪 测试CUM_RETURN多标的批量计算...")
+
+    data_a = create_test_data(30)
+    data_b = create_test_data(30)
+    data_b['ts_code'] = '159915.SZ'
+    data_b['hfq_close'] = data_b['hfq_close'] * 2
+    multi_data = pd.concat([data_a, data_b], ignore_index=True)
+
+    factor = CUM_RETURN({"periods": [5, 10]})
+    multi_result = factor.calculate_vectorized_multi(multi_data)
+
+    # 逐标的单独计算作为对照，结果应完全一致 (无跨标的串用价格)
+    single_result = pd.concat([
+        factor.calculate_vectorized(data_a),
+        factor.calculate_vectorized(data_b)
+    ], ignore_index=True)
+
+    is_consistent = all(
+        np.allclose(multi_result[col], single_result[col], equal_nan=True)
+        for col in ['CUM_RETURN_5', 'CUM_RETURN_10']
+    )
+    print(f"   输入数据: {len(multi_data)} 行, 标的数: {multi_data['ts_code'].nunique()}")
+    print(f"   与逐标的计算一致: {'✅ 通过' if is_consistent else '❌ 失败'}")
+
+
 def test_cum_return_performance():
     """性能测试"""
     print("\n🧪 测试CUM_RETURN性能...")
@@ -187,6 +206,7 @@ def run_all_tests():
         test_cum_return_basic()
         test_cum_return_edge_cases()
         test_cum_return_different_periods()
+        test_cum_return_multi_symbol()
         test_cum_return_performance()
 
         print("\n✅ 所有测试完成")
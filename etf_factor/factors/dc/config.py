@@ -3,15 +3,17 @@ DC配置管理模块
 处理参数验证、默认配置和因子元信息
 """
 
+from types import MappingProxyType
+
 
 class DcConfig:
     """唐奇安通道因子配置管理"""
 
-    # 默认参数 - 基于ETF优化的DC参数
-    DEFAULT_PARAMS = {"period": 20}
+    # 默认参数 - 基于ETF优化的DC参数 (只读，validate_params直接返回，调用方不得修改)
+    DEFAULT_PARAMS = MappingProxyType({"period": 20})
 
     # 所需数据列
-    REQUIRED_COLUMNS = ['ts_code', 'trade_date', 'hfq_high', 'hfq_low']
+    REQUIRED_COLUMNS = ('ts_code', 'trade_date', 'hfq_high', 'hfq_low')
 
     # 支持的参数范围
     MIN_PERIOD = 3
@@ -20,7 +22,7 @@ class DcConfig:
     @classmethod
     def validate_params(cls, params=None) -> dict:
         if params is None:
-            return cls.DEFAULT_PARAMS.copy()
+            return cls.DEFAULT_PARAMS
 
         if isinstance(params, dict):
             period = params.get("period", cls.DEFAULT_PARAMS["period"])
@@ -48,8 +50,8 @@ class DcConfig:
         return period
 
     @classmethod
-    def get_required_columns(cls) -> list:
-        return cls.REQUIRED_COLUMNS.copy()
+    def get_required_columns(cls) -> tuple:
+        return cls.REQUIRED_COLUMNS
 
     @classmethod
     def get_factor_info(cls, params: dict) -> dict:
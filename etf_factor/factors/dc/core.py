@@ -5,26 +5,31 @@ DC核心计算模块
 
 import pandas as pd
 import numpy as np
-import sys
-import os
-
-# 添加正确的项目路径
-etf_factor_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-sys.path.insert(0, etf_factor_root)
+from numpy.lib.stride_tricks import sliding_window_view
 
 from src.base_factor import BaseFactor
 from src.config import config
+from src.numba_compat import NUMBA_AVAILABLE
+from src.bottleneck_compat import BOTTLENECK_AVAILABLE, move_max, move_min
+
+from ._cache import cached_dc_upper_lower
+from ._kernels import dc_upper_lower_grouped
+from .config import DcConfig
+
+# 价格列计算精度，配置开启时使用float32减半内存带宽
+_DTYPE = np.float32 if config.get('calculation.float32_channels', False) else np.float64
+
+# 多周期计算时滑动窗口视图适用的最大周期，超过后逐周期计算
+_SLIDING_WINDOW_MAX_PERIOD = 64
 
-# 使用绝对路径导入避免模块名冲突
-import importlib.util
 
-# 导入DcConfig
-current_dir = os.path.dirname(__file__)
-config_path = os.path.join(current_dir, 'config.py')
-spec = importlib.util.spec_from_file_location("dc_config", config_path)
-config_module = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(config_module)
-DcConfig = config_module.DcConfig
+def _inf_to_nan(values: np.ndarray) -> np.ndarray:
+    """pandas rolling视±inf为缺失，bottleneck与fmax/fmin则计入极值；含inf时复制并替换为NaN"""
+    inf_mask = np.isinf(values)
+    if inf_mask.any():
+        values = values.copy()
+        values[inf_mask] = np.nan
+    return values
 
 
 class DC(BaseFactor):
@@ -33,6 +38,10 @@ class DC(BaseFactor):
     def __init__(self, params=None):
         validated_params = DcConfig.validate_params(params)
         super().__init__(validated_params)
+        # 输出列名与因子信息只依赖参数，初始化时生成一次
+        self._upper_col, self._lower_col = DcConfig.get_expected_output_columns(validated_params)
+        self._factor_info = DcConfig.get_factor_info(validated_params)
+        self._expected_columns = frozenset(('ts_code', 'trade_date', self._upper_col, self._lower_col))
 
     def calculate_vectorized(self, data: pd.DataFrame) -> pd.DataFrame:
         """
@@ -40,8 +49,6 @@ class DC(BaseFactor):
         DC_UPPER = MAX(最高价, period)  - 上轨：N日内最高价
         DC_LOWER = MIN(最低价, period)  - 下轨：N日内最低价
         """
-        result = data[['ts_code', 'trade_date']].copy()
-
         # 获取价格数据
         high_prices = data['hfq_high']
         low_prices = data['hfq_low']
@@ -49,51 +56,161 @@ class DC(BaseFactor):
         period = self.params["period"]
 
         # 向量化计算唐奇安通道
-        # 上轨：N日内最高价
-        dc_upper = high_prices.rolling(window=period, min_periods=1).max()
+        if NUMBA_AVAILABLE:
+            # 单调队列内核：一次遍历同时得到上轨(N日内最高价)和下轨(N日内最低价)
+            # 相同价格与周期的结果在实例间缓存复用
+            upper_values, lower_values = cached_dc_upper_lower(
+                high_prices.to_numpy(dtype=_DTYPE), low_prices.to_numpy(dtype=_DTYPE), period)
+        else:
+            upper_values, lower_values = self._rolling_channels(
+                high_prices.to_numpy(dtype=_DTYPE), low_prices.to_numpy(dtype=_DTYPE), period)
+
+        upper_values, lower_values = self._finalize_channels(upper_values, lower_values)
+
+        # 标识列引用输入列，与结果数组一次构建DataFrame
+        return pd.DataFrame({
+            'ts_code': data['ts_code'],
+            'trade_date': data['trade_date'],
+            self._upper_col: upper_values,
+            self._lower_col: lower_values,
+        }, copy=False)
+
+    def calculate_vectorized_multi(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        多标的批量计算唐奇安通道
+        按ts_code稳定排序使各标的数据连续，numba可用时各标的并行计算，结果按输入行顺序返回
 
-        # 下轨：N日内最低价
-        dc_lower = low_prices.rolling(window=period, min_periods=1).min()
+        Args:
+            data: 包含多个ts_code的价格数据，各标的内部需按trade_date升序排列
 
-        # 应用全局精度配置
-        precision = config.get_precision('indicator')
-        dc_upper = dc_upper.round(precision)
-        dc_lower = dc_lower.round(precision)
+        Returns:
+            包含DC_UPPER/DC_LOWER列的DataFrame，行顺序与输入一致
+        """
+        period = self.params["period"]
+
+        # 标的分组边界 (稳定排序保持各标的内部的原有顺序)
+        codes = data['ts_code'].astype('category').cat.codes.to_numpy()
+        order = np.argsort(codes, kind='stable')
+        boundaries = np.flatnonzero(np.diff(codes[order])) + 1
+        starts = np.concatenate(([0], boundaries)).astype(np.int64)
+        ends = np.concatenate((boundaries, [len(data)])).astype(np.int64)
+
+        high_values = data['hfq_high'].to_numpy(dtype=_DTYPE)[order]
+        low_values = data['hfq_low'].to_numpy(dtype=_DTYPE)[order]
+
+        if NUMBA_AVAILABLE:
+            grouped_upper = np.empty(len(data), dtype=_DTYPE)
+            grouped_lower = np.empty(len(data), dtype=_DTYPE)
+            dc_upper_lower_grouped(high_values, low_values, starts, ends, period, grouped_upper, grouped_lower)
+        else:
+            channels = [self._rolling_channels(high_values[start:end], low_values[start:end], period)
+                        for start, end in zip(starts, ends)]
+            grouped_upper = np.concatenate([upper for upper, _ in channels])
+            grouped_lower = np.concatenate([lower for _, lower in channels])
+
+        # 还原为输入行顺序
+        upper_values = np.empty_like(grouped_upper)
+        lower_values = np.empty_like(grouped_lower)
+        upper_values[order] = grouped_upper
+        lower_values[order] = grouped_lower
+
+        upper_values, lower_values = self._finalize_channels(upper_values, lower_values)
+
+        return pd.DataFrame({
+            'ts_code': data['ts_code'],
+            'trade_date': data['trade_date'],
+            self._upper_col: upper_values,
+            self._lower_col: lower_values,
+        }, copy=False)
+
+    def calculate_multi_period(self, data: pd.DataFrame, periods: list) -> pd.DataFrame:
+        """
+        一次计算多个周期的唐奇安通道
+        最大周期较小时对补齐后的价格构建一次滑动窗口视图，各周期取窗口末尾p列归约；
+        周期较大时窗口视图的O(N·P)归约不再划算，逐周期使用单周期计算
 
-        # 添加到结果
-        result[f'DC_UPPER_{period}'] = dc_upper
-        result[f'DC_LOWER_{period}'] = dc_lower
+        Args:
+            data: 包含hfq_high/hfq_low的价格数据
+            periods: 周期列表
 
-        # 数据验证和清理
-        # 确保上轨 >= 下轨
-        mask = result[f'DC_UPPER_{period}'] < result[f'DC_LOWER_{period}']
-        if mask.any():
-            # 交换异常值
-            temp = result.loc[mask, f'DC_UPPER_{period}'].copy()
-            result.loc[mask, f'DC_UPPER_{period}'] = result.loc[mask, f'DC_LOWER_{period}']
-            result.loc[mask, f'DC_LOWER_{period}'] = temp
+        Returns:
+            包含各周期DC_UPPER/DC_LOWER列的DataFrame
+        """
+        periods = [DcConfig.validate_params({"period": p})["period"] for p in periods]
+        max_period = max(periods)
+
+        columns = {'ts_code': data['ts_code'], 'trade_date': data['trade_date']}
+
+        if max_period > _SLIDING_WINDOW_MAX_PERIOD or len(data) == 0:
+            for period in periods:
+                period_result = DC({"period": period}).calculate_vectorized(data)
+                columns[f'DC_UPPER_{period}'] = period_result[f'DC_UPPER_{period}'].to_numpy()
+                columns[f'DC_LOWER_{period}'] = period_result[f'DC_LOWER_{period}'].to_numpy()
+            return pd.DataFrame(columns, copy=False)
+
+        # 前端补NaN使每行都有完整窗口，fmax/fmin跳过NaN，效果等同min_periods=1
+        pad = np.full(max_period - 1, np.nan, dtype=_DTYPE)
+        high_windows = sliding_window_view(_inf_to_nan(np.concatenate([pad, data['hfq_high'].to_numpy(dtype=_DTYPE)])), max_period)
+        low_windows = sliding_window_view(_inf_to_nan(np.concatenate([pad, data['hfq_low'].to_numpy(dtype=_DTYPE)])), max_period)
+
+        for period in periods:
+            upper_values = np.fmax.reduce(high_windows[:, -period:], axis=1)
+            lower_values = np.fmin.reduce(low_windows[:, -period:], axis=1)
+            upper_values, lower_values = self._finalize_channels(upper_values, lower_values)
+            columns[f'DC_UPPER_{period}'] = upper_values
+            columns[f'DC_LOWER_{period}'] = lower_values
+
+        return pd.DataFrame(columns, copy=False)
+
+    @staticmethod
+    def _rolling_channels(high_values: np.ndarray, low_values: np.ndarray, period: int) -> tuple:
+        """不使用numba内核时的滚动极值：优先bottleneck，否则pandas rolling"""
+        if BOTTLENECK_AVAILABLE and len(high_values) > 0:
+            # bottleneck滑动窗口极值 (min_count=1与rolling的min_periods=1一致)
+            # bottleneck要求窗口不超过数据长度，min_count=1时截断窗口不影响结果
+            window = min(period, len(high_values))
+            return (move_max(_inf_to_nan(high_values), window=window, min_count=1),
+                    move_min(_inf_to_nan(low_values), window=window, min_count=1))
+
+        # 上轨：N日内最高价；下轨：N日内最低价
+        return (pd.Series(high_values).rolling(window=period, min_periods=1).max().to_numpy(),
+                pd.Series(low_values).rolling(window=period, min_periods=1).min().to_numpy())
+
+    @staticmethod
+    def _finalize_channels(upper_values: np.ndarray, lower_values: np.ndarray) -> tuple:
+        """应用全局精度配置，并确保上轨 >= 下轨 (可写数组原地处理，缓存等只读数组先复制)"""
+        if not upper_values.flags.writeable:
+            upper_values = upper_values.copy()
+        if not lower_values.flags.writeable:
+            lower_values = lower_values.copy()
+
+        precision = config.get_precision('indicator')
+        np.round(upper_values, precision, out=upper_values)
+        np.round(lower_values, precision, out=lower_values)
 
-        return result
+        # 交换异常值 (含NaN的位置比较为False，保持原值)
+        swap = upper_values < lower_values
+        if swap.any():
+            upper_values[swap], lower_values[swap] = lower_values[swap], upper_values[swap]
+        return upper_values, lower_values
 
-    def get_required_columns(self) -> list:
+    def get_required_columns(self) -> tuple:
         return DcConfig.get_required_columns()
 
     def get_factor_info(self) -> dict:
-        return DcConfig.get_factor_info(self.params)
+        return self._factor_info
 
     def validate_calculation_result(self, result: pd.DataFrame) -> bool:
         try:
-            expected_columns = ['ts_code', 'trade_date'] + DcConfig.get_expected_output_columns(self.params)
-            if not all(col in result.columns for col in expected_columns):
+            if not self._expected_columns.issubset(result.columns):
                 return False
 
             if len(result) == 0:
                 return False
 
             # 检查DC值的合理性
-            period = self.params['period']
-            upper_col = f'DC_UPPER_{period}'
-            lower_col = f'DC_LOWER_{period}'
+            upper_col = self._upper_col
+            lower_col = self._lower_col
 
             upper_values = result[upper_col].dropna()
             lower_values = result[lower_col].dropna()
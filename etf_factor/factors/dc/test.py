@@ -1,19 +1,13 @@
 """
 DC测试模块
 独立的测试和示例功能
+运行方式 (etf_factor目录下): python -m factors.dc.test
 """
 
 import pandas as pd
 import numpy as np
-import sys
-import os
-
-# 添加路径以导入因子
-current_dir = os.path.dirname(__file__)
-sys.path.insert(0, current_dir)
-
-from core import DC
-from validation import DcValidation
+from .core import DC
+from .validation import DcValidation
 
 
 def test_dc_basic():
@@ -80,7 +74,7 @@ def test_dc_validation():
 
     # 运行完整验证
     is_valid, validation_results = DcValidation.run_full_validation(
-        test_data, result, factor.params
+        test_data, result, factor.params, strict=True
     )
 
     print(f"   整体验证: {'✅ 通过' if is_valid else '❌ 失败'}")
@@ -191,6 +185,84 @@ def test_dc_different_periods():
     return results
 
 
+def test_dc_repeated_calculation():
+    print("🧪 测试DC重复计算一致性...")
+
+    test_data = pd.DataFrame({
+        'ts_code': ['510580.SH'] * 30,
+        'trade_date': pd.date_range('2025-01-01', periods=30),
+        'hfq_high': [10.0 + 0.1 * i + 0.2 * (i % 5) for i in range(30)],
+        'hfq_low': [9.5 + 0.1 * i - 0.1 * (i % 4) for i in range(30)]
+    })
+
+    # 同一数据多个实例重复计算 (可能命中缓存)，结果应完全一致
+    first = DC({"period": 10}).calculate_vectorized(test_data)
+    second = DC({"period": 10}).calculate_vectorized(test_data)
+    print(f"   重复计算一致: {'✅ 通过' if first.equals(second) else '❌ 失败'}")
+
+    # 修改价格后结果应随之更新，不应返回旧结果
+    modified_data = test_data.copy()
+    modified_data.loc[5, 'hfq_high'] = 100.0
+    modified = DC({"period": 10}).calculate_vectorized(modified_data)
+    is_updated = modified['DC_UPPER_10'].iloc[5] == 100.0
+    print(f"   数据变化后结果更新: {'✅ 通过' if is_updated else '❌ 失败'}")
+
+
+def test_dc_multi_period():
+    print("🧪 测试DC多周期批量计算...")
+
+    np.random.seed(7)
+    prices = 10 + np.cumsum(np.random.normal(0, 0.05, 60))
+    test_data = pd.DataFrame({
+        'ts_code': ['510580.SH'] * 60,
+        'trade_date': pd.date_range('2025-01-01', periods=60),
+        'hfq_high': prices + 0.05,
+        'hfq_low': prices - 0.05
+    })
+
+    periods = [5, 10, 15, 20]
+    multi_result = DC().calculate_multi_period(test_data, periods)
+
+    # 与逐周期单独计算的结果对比
+    all_match = True
+    for period in periods:
+        single_result = DC({"period": period}).calculate_vectorized(test_data)
+        for col in [f'DC_UPPER_{period}', f'DC_LOWER_{period}']:
+            if not np.allclose(multi_result[col], single_result[col], equal_nan=True):
+                all_match = False
+
+    print(f"   输出列数: {len(multi_result.columns)}")
+    print(f"   与单周期计算一致: {'✅ 通过' if all_match else '❌ 失败'}")
+
+
+def test_dc_multi_symbol():
+    print("🧪 测试DC多标的批量计算...")
+
+    np.random.seed(11)
+    frames = []
+    for ts_code in ['510580.SH', '159915.SZ']:
+        prices = 10 + np.cumsum(np.random.normal(0, 0.05, 30))
+        frames.append(pd.DataFrame({
+            'ts_code': [ts_code] * 30,
+            'trade_date': pd.date_range('2025-01-01', periods=30),
+            'hfq_high': prices + 0.05,
+            'hfq_low': prices - 0.05
+        }))
+    multi_data = pd.concat(frames, ignore_index=True)
+
+    factor = DC({"period": 10})
+    multi_result = factor.calculate_vectorized_multi(multi_data)
+
+    # 逐标的单独计算作为对照，结果应一致 (无跨标的串用价格)
+    single_result = pd.concat([factor.calculate_vectorized(frame) for frame in frames], ignore_index=True)
+    is_consistent = all(
+        np.allclose(multi_result[col], single_result[col], equal_nan=True)
+        for col in ['DC_UPPER_10', 'DC_LOWER_10']
+    )
+    print(f"   输入数据: {len(multi_data)} 行, 标的数: {multi_data['ts_code'].nunique()}")
+    print(f"   与逐标的计算一致: {'✅ 通过' if is_consistent else '❌ 失败'}")
+
+
 def run_all_tests():
     print("📊 唐奇安通道因子模块化测试")
     print("=" * 50)
@@ -203,6 +275,12 @@ def run_all_tests():
         test_dc_edge_cases()
         print()
         test_dc_different_periods()
+        print()
+        test_dc_repeated_calculation()
+        print()
+        test_dc_multi_period()
+        print()
+        test_dc_multi_symbol()
         print("\n✅ 所有测试完成")
     except Exception as e:
         print(f"\n❌ 测试失败: {e}")
@@ -3,20 +3,7 @@ EMA - 指数移动均线因子模块
 Exponential Moving Average - 对近期价格给予更高权重的模块化实现
 """
 
-# 使用绝对路径导入避免模块名冲突
-import os
-import sys
-import importlib.util
-
-# 直接使用绝对路径导入core模块
-current_dir = os.path.dirname(__file__)
-core_path = os.path.join(current_dir, 'core.py')
-
-spec = importlib.util.spec_from_file_location("ema_core", core_path)
-core_module = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(core_module)
-
-EMA = core_module.EMA
+from .core import EMA
 
 # 保持向后兼容性
 __all__ = ['EMA']
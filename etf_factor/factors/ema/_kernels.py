@@ -0,0 +1,64 @@
+"""
+EMA计算内核
+单次遍历价格序列完成全部周期的指数递推，避免每个周期单独构建ewm对象
+递推与pandas ewm(adjust=False)逐步一致 (含NaN间隔的权重衰减，±inf同pandas视为缺失)，结果逐位相同
+精度取整、无穷值与范围清理在写出时一并完成，各周期相互独立按周期并行
+"""
+
+import numpy as np
+
+from src.numba_compat import NUMBA_AVAILABLE, njit, prange
+from src.numba_kernels import finalize
+
+if NUMBA_AVAILABLE:
+    from numba import types
+
+
+def span_to_alpha(period: int) -> float:
+    """span转平滑系数，与pandas的计算顺序一致: com=(span-1)/2, α=1/(1+com)"""
+    return 1.0 / (1.0 + (period - 1) / 2.0)
+
+
+# 显式签名: 导入时即完成编译 (cache=True时直接从磁盘缓存加载)，首次调用无JIT开销
+# 调用方固定传入C连续的float64数组；价格数组可能是pandas返回的只读视图，两种情形各备一个签名
+if NUMBA_AVAILABLE:
+    _F8_1D = types.Array(types.float64, 1, 'C')
+    _F8_2D = types.Array(types.float64, 2, 'C')
+    _EMA_MULTI_SIGNATURES = [
+        types.void(prices_type, _F8_1D, types.float64, types.float64, types.float64, _F8_2D)
+        for prices_type in (_F8_1D, types.Array(types.float64, 1, 'C', readonly=True))
+    ]
+else:
+    _EMA_MULTI_SIGNATURES = []
+
+
+@njit(_EMA_MULTI_SIGNATURES, parallel=True, cache=True)
+def ema_multi(prices, alphas, scale, range_min, range_max, out):
+    """
+    多周期EMA: out[j] 为以alphas[j]递推并完成取整/范围清理的EMA (每个周期一行，内层写入连续)
+    首个有效值之前为NaN；NaN处沿用上一EMA值，其后新观测的旧权重按间隔长度衰减
+    递推状态只使用未取整的值，取整仅作用于写出结果
+    """
+    n = prices.shape[0]
+    for j in prange(alphas.shape[0]):
+        alpha = alphas[j]
+        old_wt_factor = 1.0 - alpha
+        weighted = np.nan
+        old_wt = 1.0
+        for i in range(n):
+            cur = prices[i]
+            if np.isinf(cur):
+                cur = np.nan
+            if i == 0:
+                weighted = cur
+            else:
+                if weighted == weighted:
+                    old_wt *= old_wt_factor
+                    if cur == cur:
+                        # 常数序列跳过加权，避免数值误差
+                        if weighted != cur:
+                            weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+                        old_wt = 1.0
+                elif cur == cur:
+                    weighted = cur
+            out[j, i] = finalize(weighted, scale, range_min, range_max)
@@ -3,15 +3,17 @@ EMA配置管理模块
 处理参数验证、默认配置和因子元信息
 """
 
+from types import MappingProxyType
+
 
 class EmaConfig:
     """指数移动均线因子配置管理"""
 
-    # 默认参数
-    DEFAULT_PARAMS = {"periods": [5, 10, 20, 60]}
+    # 默认参数 (只读，validate_params直接返回，调用方不得修改)
+    DEFAULT_PARAMS = MappingProxyType({"periods": (5, 10, 20, 60)})
 
     # 所需数据列
-    REQUIRED_COLUMNS = ['ts_code', 'trade_date', 'hfq_close']
+    REQUIRED_COLUMNS = ('ts_code', 'trade_date', 'hfq_close')
 
     # 支持的周期范围
     MIN_PERIOD = 2
@@ -32,10 +34,10 @@ class EmaConfig:
             ValueError: 当参数不符合要求时
         """
         if params is None:
-            return cls.DEFAULT_PARAMS.copy()
+            return cls.DEFAULT_PARAMS
 
         if isinstance(params, dict):
-            periods = params.get("periods", cls.DEFAULT_PARAMS["periods"])
+            periods = params.get("periods", list(cls.DEFAULT_PARAMS["periods"]))
         elif isinstance(params, list):
             periods = params
         else:
@@ -72,15 +74,15 @@ class EmaConfig:
 
             validated_periods.append(period)
 
-        # 去重并排序
-        validated_periods = sorted(list(set(validated_periods)))
+        # 去重并排序 (重复周期只计算一次)
+        validated_periods = sorted(set(validated_periods))
 
         return validated_periods
 
     @classmethod
-    def get_required_columns(cls) -> list:
+    def get_required_columns(cls) -> tuple:
         """获取所需数据列"""
-        return cls.REQUIRED_COLUMNS.copy()
+        return cls.REQUIRED_COLUMNS
 
     @classmethod
     def get_factor_info(cls, params: dict) -> dict:
@@ -4,30 +4,25 @@ EMA核心计算模块
 """
 
 import pandas as pd
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+import numpy as np
 
 from src.base_factor import BaseFactor
 from src.config import config
+from src.numba_compat import NUMBA_AVAILABLE
 
-# 使用绝对路径导入避免模块名冲突
-import importlib.util
+from ._kernels import ema_multi, span_to_alpha
+from .config import EmaConfig
+from .validation import EmaValidator
 
-# 导入EmaConfig
-current_dir = os.path.dirname(__file__)
-config_path = os.path.join(current_dir, 'config.py')
-spec = importlib.util.spec_from_file_location("ema_config", config_path)
-config_module = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(config_module)
-EmaConfig = config_module.EmaConfig
 
-# 导入EmaValidator
-validation_path = os.path.join(current_dir, 'validation.py')
-spec = importlib.util.spec_from_file_location("ema_validation", validation_path)
-validation_module = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(validation_module)
-EmaValidator = validation_module.EmaValidator
+# 精度与有效范围均为常量配置，导入时读取一次
+_PRECISION = config.get_precision('price')
+_RANGE_MIN, _RANGE_MAX = config.get_data_range('price')
+
+# 内核参数: 与np.round相同的10^d取整因子，未配置的边界以±inf代替
+_SCALE = 10.0 ** _PRECISION
+_KERNEL_RANGE_MIN = -np.inf if _RANGE_MIN is None else float(_RANGE_MIN)
+_KERNEL_RANGE_MAX = np.inf if _RANGE_MAX is None else float(_RANGE_MAX)
 
 
 class EMA(BaseFactor):
@@ -42,6 +37,8 @@ class EMA(BaseFactor):
         validated_params = EmaConfig.validate_params(params)
         super().__init__(validated_params)
         self.validator = EmaValidator(self.params)
+        # 平滑系数只依赖周期，初始化时计算一次，各次调用直接传给内核
+        self._alphas = np.array([span_to_alpha(p) for p in self.params["periods"]], dtype=np.float64)
 
     def calculate_vectorized(self, data: pd.DataFrame) -> pd.DataFrame:
         """
@@ -61,54 +58,74 @@ class EMA(BaseFactor):
         # 输入数据验证
         self.validator.validate_input_data(data)
 
-        result = data[['ts_code', 'trade_date']].copy()
-
-        # 获取收盘价数据 (按日期升序排列用于EMA计算)
-        data_sorted = data.sort_values('trade_date')
+        # 按日期升序排列用于EMA计算: 已升序时直接使用，严格降序 (最新在前的常见输入) 时倒序视图，
+        # 否则单次稳定排序 (空日期排在末尾)
+        dates = data['trade_date']
+        if dates.is_monotonic_increasing:
+            data_sorted = data
+        elif dates.is_monotonic_decreasing and dates.is_unique:
+            data_sorted = data.iloc[::-1]
+        else:
+            data_sorted = data.sort_values('trade_date', kind='stable')
         close_prices = data_sorted['hfq_close']
 
-        # 计算各周期的EMA
-        for period in self.params["periods"]:
-            column_name = f'EMA_{period}'
+        # 标识列与各周期结果共用升序索引，收集后一次构建DataFrame，无需对齐
+        columns = {'ts_code': data_sorted['ts_code'], 'trade_date': data_sorted['trade_date']}
 
-            # 核心算法：计算指数移动均线
-            ema_values = self._calculate_period_ema(close_prices, period)
+        # 计算各周期的EMA
+        for column_name, ema_values in self._calculate_all_periods(close_prices):
+            columns[column_name] = ema_values
 
-            result[column_name] = ema_values
+        result = pd.DataFrame(columns, copy=False)
 
-        # 恢复原始排序（最新日期在前）
-        result = result.sort_values('trade_date', ascending=False).reset_index(drop=True)
+        # 恢复原始排序（最新日期在前）: 有效日期部分倒序，空日期行保持在末尾，无需第二次排序
+        n_valid = len(result) - int(dates.isna().sum())
+        if n_valid == len(result):
+            result = result.iloc[::-1]
+        else:
+            result = result.take(np.r_[n_valid - 1:-1:-1, n_valid:len(result)])
+        result = result.reset_index(drop=True)
 
         return result
 
-    def _calculate_period_ema(self, prices: pd.Series, period: int) -> pd.Series:
-        """计算指定周期的指数移动均线"""
+    def _calculate_all_periods(self, prices: pd.Series):
+        """逐个产出 (列名, EMA序列)；全部周期写入同一(周期数, N)矩阵，后处理对整块一次完成"""
+        periods = self.params["periods"]
+        out = np.empty((len(periods), len(prices)), dtype=np.float64)
+
+        if NUMBA_AVAILABLE:
+            # 一次内核调用算出全部周期，取整与范围清理已在内核中完成
+            # (pandas ewm的numba引擎method='table'要求各列共用同一span，无法表达多周期，故使用自定义内核)
+            values = np.ascontiguousarray(prices.to_numpy(dtype=np.float64))
+            ema_multi(values, self._alphas, _SCALE, _KERNEL_RANGE_MIN, _KERNEL_RANGE_MAX, out)
+        else:
+            for j, period in enumerate(periods):
+                out[j] = self._calculate_period_ema(prices, period)
+            out = self._process_calculation_result(out)
+
+        for j, period in enumerate(periods):
+            yield f'EMA_{period}', pd.Series(out[j], index=prices.index, copy=False)
+
+    def _calculate_period_ema(self, prices: pd.Series, period: int) -> np.ndarray:
+        """计算指定周期的指数移动均线 (未经后处理)"""
         # pandas向量化计算EMA - 核心优化点
-        ema_values = prices.ewm(
+        return prices.ewm(
             span=period,           # EMA周期
             adjust=False           # 不调整权重（标准EMA算法）
-        ).mean()
+        ).mean().to_numpy(dtype=np.float64)
 
-        # 数据处理
-        ema_values = self._process_calculation_result(ema_values)
-
-        return ema_values
-
-    def _process_calculation_result(self, ema_values: pd.Series) -> pd.Series:
-        """处理计算结果，包括精度控制和异常值处理"""
-        # 应用精度配置
-        precision = config.get_precision('price')
-        ema_values = ema_values.round(precision)
+    def _process_calculation_result(self, ema_values: np.ndarray) -> np.ndarray:
+        """处理计算结果 (单列或多周期整块)，包括精度控制和异常值处理，全程在float64 ndarray上完成"""
+        # 应用精度配置 (原地)
+        np.round(ema_values, _PRECISION, out=ema_values)
 
         # 处理无穷大值
-        ema_values = ema_values.replace([float('inf'), -float('inf')], pd.NA)
-
-        # 数据范围验证和修正
-        ema_values = config.validate_data_range(ema_values, 'price')
+        ema_values[np.isinf(ema_values)] = np.nan
 
-        return ema_values
+        # 数据范围验证和修正 (超出范围的值设为NaN)
+        return config.validate_data_range(ema_values, 'price')
 
-    def get_required_columns(self) -> list:
+    def get_required_columns(self) -> tuple:
         """获取计算所需的数据列"""
         return EmaConfig.get_required_columns()
 
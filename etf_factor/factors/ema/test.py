@@ -1,18 +1,12 @@
 """
 EMA测试模块
 独立的测试和示例功能
+运行方式 (etf_factor目录下): python -m factors.ema.test
 """
 
 import pandas as pd
 import numpy as np
-import sys
-import os
-
-# 添加路径以导入因子
-current_dir = os.path.dirname(__file__)
-sys.path.insert(0, current_dir)
-
-from core import EMA
+from .core import EMA
 
 
 def create_test_data(length=20, price_pattern="uptrend") -> pd.DataFrame:
@@ -232,6 +226,12 @@ def test_ema_edge_cases():
     if len(jump_ema) > 0:
         print(f"   价格跳跃测试: EMA范围 [{jump_ema.min():.1f}, {jump_ema.max():.1f}]")
 
+    # 测试5: 重复周期只计算一次
+    dup_factor = EMA({"periods": [5, 5, 10]})
+    dup_columns = [col for col in dup_factor.calculate_vectorized(jump_data).columns if col.startswith('EMA_')]
+    dedup_ok = dup_factor.params['periods'] == [5, 10] and dup_columns == ['EMA_5', 'EMA_10']
+    print(f"   重复周期测试: {'✅ 已去重' if dedup_ok else '❌ 存在重复周期'}")
+
 
 def test_ema_performance():
     """性能测试"""
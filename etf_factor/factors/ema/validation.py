@@ -5,18 +5,9 @@ EMA数据验证模块
 
 import pandas as pd
 import numpy as np
+import warnings
 
-# 使用绝对路径导入避免模块名冲突
-import importlib.util
-import os
-
-# 导入EmaConfig
-current_dir = os.path.dirname(__file__)
-config_path = os.path.join(current_dir, 'config.py')
-spec = importlib.util.spec_from_file_location("ema_config", config_path)
-config_module = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(config_module)
-EmaConfig = config_module.EmaConfig
+from .config import EmaConfig
 
 
 class EmaValidator:
@@ -25,6 +16,9 @@ class EmaValidator:
     def __init__(self, params: dict):
         self.config = EmaConfig
         self.params = params
+        # 必需输入列与预期输出列集合只依赖参数，初始化时生成一次
+        self._required_columns = frozenset(EmaConfig.get_required_columns())
+        self._expected_columns = frozenset(('ts_code', 'trade_date', *EmaConfig.get_expected_output_columns(params)))
 
     def validate_input_data(self, data: pd.DataFrame) -> None:
         """
@@ -44,15 +38,13 @@ class EmaValidator:
             raise ValueError("输入数据不能为空")
 
         # 检查必需列
-        required_columns = self.config.get_required_columns()
-        missing_columns = [col for col in required_columns if col not in data.columns]
+        missing_columns = self._required_columns.difference(data.columns)
         if missing_columns:
-            raise ValueError(f"缺少必需的数据列: {missing_columns}")
+            raise ValueError(f"缺少必需的数据列: {sorted(missing_columns)}")
 
         # 检查数据长度是否足够
         max_period = max(self.params['periods'])
         if len(data) < max_period:
-            import warnings
             warnings.warn(f"数据长度({len(data)})小于最大计算周期({max_period})，EMA结果可能不稳定")
 
         # 检查收盘价数据
@@ -79,7 +71,6 @@ class EmaValidator:
         # 检查连续性（不应有过多的空值）
         null_ratio = prices.isnull().sum() / len(prices)
         if null_ratio > 0.3:  # 30%以上为空值
-            import warnings
             warnings.warn(f"价格数据空值比例过高({null_ratio:.1%})，可能影响EMA计算准确性")
 
         # 检查价格异常值
@@ -89,7 +80,6 @@ class EmaValidator:
             if price_mean > 0:
                 cv = price_std / price_mean  # 变异系数
                 if cv > 5:  # 变异系数过大，可能存在异常值
-                    import warnings
                     warnings.warn(f"价格数据变异系数过大({cv:.2f})，可能存在异常值，影响EMA准确性")
 
     def _validate_date_data(self, dates: pd.Series) -> None:
@@ -123,8 +113,7 @@ class EmaValidator:
                 return False
 
             # 检查输出列
-            expected_columns = ['ts_code', 'trade_date'] + self.config.get_expected_output_columns(self.params)
-            if not all(col in result.columns for col in expected_columns):
+            if not self._expected_columns.issubset(result.columns):
                 return False
 
             # 检查各周期的EMA数据
@@ -175,7 +164,6 @@ class EmaValidator:
                 ema_mean = non_null_ema.mean()
                 large_jump_ratio = (ema_diff.abs() > ema_mean * 0.5).sum() / len(ema_diff)
                 if large_jump_ratio > 0.1:  # 10%以上的点有大跳跃
-                    import warnings
                     warnings.warn(f"周期{period}的EMA存在异常大的跳跃({large_jump_ratio:.1%})，请检查数据质量")
 
             # 检查EMA的趋势一致性
@@ -183,7 +171,6 @@ class EmaValidator:
             if len(non_null_ema) > 10:
                 ema_volatility = ema_diff.std() / non_null_ema.mean() if non_null_ema.mean() > 0 else 0
                 if ema_volatility > 0.2:  # 波动率超过20%
-                    import warnings
                     warnings.warn(f"周期{period}的EMA波动率过高({ema_volatility:.1%})，可能需要检查数据质量")
 
         return True
\ No newline at end of file
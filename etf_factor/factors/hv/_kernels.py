@@ -0,0 +1,73 @@
+"""
+HV计算内核
+固定窗口滚动标准差 (Welford + Kahan补偿，增删逐步与pandas rolling().std()一致)，
+年化、精度取整、无穷值与范围清理在写出时一并完成；各周期相互独立按周期并行
+"""
+
+import numpy as np
+
+from src.numba_compat import njit, prange
+from src.numba_kernels import finalize
+
+
+@njit(parallel=True, cache=True)
+def hv_multi(returns, periods, annualize, scale, range_min, range_max, out):
+    """
+    多周期历史波动率: out[j] 为returns在periods[j]窗口上的样本标准差(ddof=1) × annualize
+    窗口内有效值不足period时为NaN；±inf同pandas视为缺失
+    returns/out可为float32或float64，均值与平方和等累加量固定为float64
+    """
+    n = returns.shape[0]
+    for j in prange(periods.shape[0]):
+        period = periods[j]
+        nobs = 0
+        mean_x = 0.0
+        ssqdm_x = 0.0
+        comp_add = 0.0
+        comp_remove = 0.0
+        same_count = 0
+        prev_value = np.nan
+        for i in range(n):
+            # 移除滑出窗口的值
+            if i >= period:
+                val = returns[i - period]
+                if not np.isnan(val) and not np.isinf(val):
+                    nobs -= 1
+                    if nobs:
+                        prev_mean = mean_x - comp_remove
+                        y = val - comp_remove
+                        t = y - mean_x
+                        comp_remove = t + mean_x - y
+                        mean_x -= t / nobs
+                        ssqdm_x -= (val - prev_mean) * (val - mean_x)
+                    else:
+                        mean_x = 0.0
+                        ssqdm_x = 0.0
+
+            # 加入新值
+            val = returns[i]
+            if not np.isnan(val) and not np.isinf(val):
+                # 记录连续相同值个数，窗口内全部相同时方差直接取0，消除浮点残差
+                if val == prev_value:
+                    same_count += 1
+                else:
+                    same_count = 1
+                prev_value = val
+                nobs += 1
+                prev_mean = mean_x - comp_add
+                y = val - comp_add
+                t = y - mean_x
+                comp_add = t + mean_x - y
+                mean_x += t / nobs
+                ssqdm_x += (val - prev_mean) * (val - mean_x)
+
+            if nobs >= period and nobs > 1:
+                if same_count >= nobs:
+                    var = 0.0
+                else:
+                    var = ssqdm_x / (nobs - 1)
+                # 与pandas一致: 负方差(浮点误差)开方记为0
+                std = np.sqrt(var) if var >= 0 else 0.0
+                out[j, i] = finalize(std * annualize, scale, range_min, range_max)
+            else:
+                out[j, i] = np.nan
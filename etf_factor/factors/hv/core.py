@@ -5,26 +5,25 @@ HV核心计算模块
 
 import pandas as pd
 import numpy as np
-import sys
-import os
-
-# 添加正确的项目路径
-etf_factor_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-sys.path.insert(0, etf_factor_root)
 
 from src.base_factor import BaseFactor
 from src.config import config
+from src.numba_compat import NUMBA_AVAILABLE
+
+from ._kernels import hv_multi
+from .config import HvConfig
+
 
-# 使用绝对路径导入避免模块名冲突
-import importlib.util
+# 年化系数、精度与有效范围均为常量，导入时读取一次
+_ANNUALIZE = np.sqrt(252)
+_PRECISION = config.get_precision('percentage')
+_RANGE_MIN, _RANGE_MAX = config.get_data_range('percentage')
+_DTYPE = np.float32 if config.get('calculation.float32_returns', False) else np.float64
 
-# 导入HvConfig
-current_dir = os.path.dirname(__file__)
-config_path = os.path.join(current_dir, 'config.py')
-spec = importlib.util.spec_from_file_location("hv_config", config_path)
-config_module = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(config_module)
-HvConfig = config_module.HvConfig
+# 内核参数: 与np.round相同的10^d取整因子，未配置的边界以±inf代替
+_SCALE = 10.0 ** _PRECISION
+_KERNEL_RANGE_MIN = -np.inf if _RANGE_MIN is None else float(_RANGE_MIN)
+_KERNEL_RANGE_MAX = np.inf if _RANGE_MAX is None else float(_RANGE_MAX)
 
 
 class HV(BaseFactor):
@@ -33,42 +32,55 @@ class HV(BaseFactor):
     def __init__(self, params=None):
         validated_params = HvConfig.validate_params(params)
         super().__init__(validated_params)
+        self._period_array = np.asarray(self.params["periods"], dtype=np.int64)
 
     def calculate_vectorized(self, data: pd.DataFrame) -> pd.DataFrame:
         """
         向量化计算历史波动率
         HV = STD(日收益率) × √252 (年化)
         """
-        result = data[['ts_code', 'trade_date']].copy()
-
-        close_prices = data['hfq_close']
-        # 计算日收益率
-        returns = close_prices.pct_change()
-
-        # 计算各周期的历史波动率
-        for period in self.params["periods"]:
-            column_name = f'HV_{period}'
-
-            # 使用滚动窗口计算历史波动率
-            # 标准差 * √252 得到年化波动率
-            rolling_std = returns.rolling(window=period, min_periods=period).std()
-            hv_values = rolling_std * np.sqrt(252)
-
-            # 应用全局精度配置
-            precision = config.get_precision('percentage')
-            hv_values = hv_values.round(precision)
-
-            result[column_name] = hv_values
-
-        # 数据验证和清理
-        numeric_columns = [col for col in result.columns if col.startswith('HV_')]
-        for col in numeric_columns:
-            # 清理无穷大值
-            result[col] = result[col].replace([float('inf'), -float('inf')], pd.NA)
-            # 验证数据范围
-            result[col] = config.validate_data_range(result[col], 'percentage')
-
-        return result
+        close_prices = data['hfq_close'].to_numpy(dtype=np.float64)
+
+        # 计算日收益率 (与pct_change相同的 今日/昨日 - 1，首行为NaN)，除与减均写回同一缓冲区
+        returns = np.empty(len(close_prices), dtype=np.float64)
+        returns[:1] = np.nan
+        body = returns[1:]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            np.divide(close_prices[1:], close_prices[:-1], out=body)
+        np.subtract(body, 1.0, out=body)
+
+        periods = self.params["periods"]
+        # 全部周期写入同一(周期数, N)矩阵，按配置使用float32或float64存储
+        out = np.empty((len(periods), len(returns)), dtype=_DTYPE)
+        if NUMBA_AVAILABLE:
+            # 单次内核调用完成全部周期的滚动标准差、年化、取整与范围清理
+            # 内核累加量始终为float64
+            hv_multi(returns.astype(_DTYPE, copy=False), self._period_array, _ANNUALIZE,
+                     _SCALE, _KERNEL_RANGE_MIN, _KERNEL_RANGE_MAX, out)
+        else:
+            out[:] = self._rolling_hv(pd.Series(returns, copy=False), periods)
+
+        # 标识列引用输入列，与各周期结果一次构建DataFrame，不复制标识列
+        columns = {'ts_code': data['ts_code'], 'trade_date': data['trade_date']}
+        for j, period in enumerate(periods):
+            columns[f'HV_{period}'] = out[j]
+
+        return pd.DataFrame(columns, copy=False)
+
+    def _rolling_hv(self, returns: pd.Series, periods) -> np.ndarray:
+        """pandas回退路径: 逐周期滚动标准差写入float64矩阵，年化、取整与清理对整块一次完成"""
+        hv = np.empty((len(periods), len(returns)), dtype=np.float64)
+        for j, period in enumerate(periods):
+            # 滚动标准差由pandas在C层以O(N)滑动方差完成
+            hv[j] = returns.rolling(window=period, min_periods=period).std().to_numpy(dtype=np.float64)
+
+        # 标准差 * √252 得到年化波动率，应用全局精度配置 (均原地)
+        np.multiply(hv, _ANNUALIZE, out=hv)
+        np.round(hv, _PRECISION, out=hv)
+
+        # 数据验证和清理: 清理无穷大值并验证数据范围
+        hv[np.isinf(hv)] = np.nan
+        return config.validate_data_range(hv, 'percentage')
 
     def get_required_columns(self) -> list:
         return HvConfig.get_required_columns()
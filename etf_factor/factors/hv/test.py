@@ -1,31 +1,24 @@
 """
 HV测试模块
 独立的测试和示例功能
+运行方式 (etf_factor目录下): python -m factors.hv.test
 """
 
 import pandas as pd
 import numpy as np
-import sys
-import os
+from .core import HV
+from .validation import HvValidation
 
-# 添加路径以导入因子
-current_dir = os.path.dirname(__file__)
-sys.path.insert(0, current_dir)
-
-from core import HV
-from validation import HvValidation
+# 测试用交易日期，模块导入时生成一次，各测试按长度切片
+_DATES = pd.date_range('2025-01-01', periods=101)
 
 
 def test_hv_basic():
     print("🧪 测试HV基础功能...")
 
     # 创建测试数据（包含价格趋势和波动）
-    np.random.seed(42)
-    price_base = 10
-    returns = np.random.normal(0.001, 0.02, 50)  # 模拟日收益率
-    prices = [price_base]
-    for r in returns:
-        prices.append(prices[-1] * (1 + r))
+    returns = np.random.default_rng(42).normal(0.001, 0.02, 50)  # 模拟日收益率
+    prices = np.cumprod(np.concatenate(([10], 1 + returns)))
 
     test_data = pd.DataFrame({
         'ts_code': ['510580.SH'] * 51,
@@ -68,13 +61,9 @@ def test_hv_validation():
     print("🧪 测试HV验证功能...")
 
     # 创建更长的随机数据用于统计验证
-    np.random.seed(123)
     n_days = 80
-    price_base = 100
-    returns = np.random.normal(0.0005, 0.015, n_days)  # 模拟日收益率
-    prices = [price_base]
-    for r in returns:
-        prices.append(prices[-1] * (1 + r))
+    returns = np.random.default_rng(123).normal(0.0005, 0.015, n_days)  # 模拟日收益率
+    prices = np.cumprod(np.concatenate(([100], 1 + returns)))
 
     test_data = pd.DataFrame({
         'ts_code': ['510580.SH'] * (n_days + 1),
@@ -104,7 +93,7 @@ def test_hv_edge_cases():
     # 测试恒定价格（零波动）
     constant_data = pd.DataFrame({
         'ts_code': ['510580.SH'] * 30,
-        'trade_date': pd.date_range('2025-01-01', periods=30),
+        'trade_date': _DATES[:30],
         'hfq_close': [10.0] * 30  # 恒定价格
     })
 
@@ -123,10 +112,11 @@ def test_hv_edge_cases():
         print(f"   零波动检查: {'✅ 正确' if zero_vol_check else '❌ 错误'} (接近零)")
 
     # 测试高波动数据
+    idx = np.arange(30)
     high_vol_data = pd.DataFrame({
         'ts_code': ['510580.SH'] * 30,
-        'trade_date': pd.date_range('2025-01-01', periods=30),
-        'hfq_close': [10 * (1.1 if i % 2 == 0 else 0.9) ** (i // 2) for i in range(30)]  # 交替大幅波动
+        'trade_date': _DATES[:30],
+        'hfq_close': 10 * np.where(idx % 2 == 0, 1.1, 0.9) ** (idx // 2)  # 交替大幅波动
     })
 
     try:
@@ -141,8 +131,8 @@ def test_hv_edge_cases():
         factor_single = HV({"periods": [10]})
         result_single = factor_single.calculate_vectorized(test_data := pd.DataFrame({
             'ts_code': ['510580.SH'] * 25,
-            'trade_date': pd.date_range('2025-01-01', periods=25),
-            'hfq_close': [10 + 0.1 * np.sin(i * 0.5) for i in range(25)]  # 正弦波价格
+            'trade_date': _DATES[:25],
+            'hfq_close': 10 + 0.1 * np.sin(np.arange(25) * 0.5)  # 正弦波价格
         }))
 
         factor_multi = HV({"periods": [5, 10, 20]})
@@ -165,39 +155,31 @@ def test_hv_different_periods():
     print("🧪 测试HV不同周期参数...")
 
     # 创建具有不同波动模式的测试数据
-    np.random.seed(456)
     n_days = 100
     base_price = 50
 
-    # 生成具有变化波动率的价格序列
-    prices = [base_price]
-    for i in range(n_days):
-        if i < 30:
-            vol = 0.01  # 低波动期
-        elif i < 60:
-            vol = 0.03  # 中波动期
-        else:
-            vol = 0.02  # 中低波动期
-
-        daily_return = np.random.normal(0, vol)
-        prices.append(prices[-1] * (1 + daily_return))
+    # 生成具有变化波动率的价格序列: 前30日低波动，30-60日中波动，其后中低波动
+    day = np.arange(n_days)
+    vol = np.where(day < 30, 0.01, np.where(day < 60, 0.03, 0.02))
+    daily_returns = np.random.default_rng(456).normal(0, vol)
+    prices = np.cumprod(np.concatenate(([base_price], 1 + daily_returns)))
 
     test_data = pd.DataFrame({
         'ts_code': ['510580.SH'] * (n_days + 1),
-        'trade_date': pd.date_range('2025-01-01', periods=n_days + 1),
+        'trade_date': _DATES[:n_days + 1],
         'hfq_close': prices
     })
 
     periods_to_test = [5, 10, 20, 60]
     results = {}
 
-    for periods in [[p] for p in periods_to_test]:
-        factor = HV({"periods": periods})
-        result = factor.calculate_vectorized(test_data)
-        results[periods[0]] = result
+    # 各周期输出列相互独立，一次多周期计算后按列取出
+    factor = HV({"periods": periods_to_test})
+    result = factor.calculate_vectorized(test_data)
 
-        period = periods[0]
+    for period in periods_to_test:
         hv_col = f'HV_{period}'
+        results[period] = result[['ts_code', 'trade_date', hv_col]]
         hv_values = result[hv_col].dropna()
 
         if len(hv_values) > 0:
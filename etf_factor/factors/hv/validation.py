@@ -6,6 +6,9 @@ HV验证模块
 import pandas as pd
 import numpy as np
 
+# 年化系数，导入时计算一次
+_ANNUALIZE = np.sqrt(252)
+
 
 class HvValidation:
     """HV因子验证工具"""
@@ -63,16 +66,20 @@ class HvValidation:
             if len(hv_values) == 0:
                 continue  # 可能因为数据不足而全为NaN
 
+            # 一次最小值、一次最大值归约完成以下全部检查
+            values = hv_values.to_numpy()
+            lowest, highest = values.min(), values.max()
+
             # 检查HV范围（应为非负值）
-            if (hv_values < 0).any():
+            if lowest < 0:
                 return False, f"存在负的HV_{period}值"
 
             # 检查异常高的波动率（>1000%可能异常）
-            if (hv_values > 1000).any():
+            if highest > 1000:
                 return False, f"存在异常高的HV_{period}值（>1000%）"
 
-            # 检查无穷大值
-            if np.isinf(hv_values).any():
+            # 检查无穷大值 (NaN已剔除)
+            if not (np.isfinite(lowest) and np.isfinite(highest)):
                 return False, f"存在无穷大HV_{period}值"
 
         return True, "输出数据验证通过"
@@ -86,18 +93,18 @@ class HvValidation:
         # 手工验证最后几个数据点的HV计算
         periods = params['periods']
 
-        # 计算收益率
-        close_prices = data['hfq_close']
-        returns = close_prices.pct_change()
+        # 收益率一次算出 (与pct_change相同: 当日/前日 - 1)，各周期取末尾视图复用
+        close_prices = data['hfq_close'].to_numpy(dtype=np.float64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            returns = close_prices[1:] / close_prices[:-1] - 1
 
         for period in periods:
-            if len(data) >= period + 1:  # 需要至少period+1个数据点
-                # 取最后period个收益率（不包括第一个NaN）
-                recent_returns = returns.tail(period + 1).iloc[1:]  # 去掉第一个NaN
+            if len(returns) >= period:  # 需要至少period+1个数据点
+                # 取最后period个收益率，全部为有限值时才做比较 (含NaN/inf时手工值本就为NaN)
+                recent_returns = returns[-period:]
 
-                if len(recent_returns.dropna()) >= period:
-                    manual_std = recent_returns.std()
-                    manual_hv = manual_std * np.sqrt(252) if pd.notna(manual_std) else np.nan
+                if np.isfinite(recent_returns).all():
+                    manual_hv = np.std(recent_returns, ddof=1) * _ANNUALIZE
 
                     hv_col = f'HV_{period}'
                     calculated_hv = result[hv_col].iloc[-1]
@@ -0,0 +1,90 @@
+"""
+KDJ计算内核
+滚动最高/最低价 (单调队列)、RSV、K/D平滑递推与J值在一次遍历中完成，
+取整与范围截断在写出时一并完成；递推与逐日公式 K=2/3×K_prev+1/3×RSV、D=2/3×D_prev+1/3×K 逐位一致
+"""
+
+import numpy as np
+
+from src.numba_compat import NUMBA_AVAILABLE, njit
+
+if NUMBA_AVAILABLE:
+    from numba import types
+
+
+@njit(cache=True)
+def _round_clip(value, scale, lower, upper):
+    """与np.round(x, decimals)相同的取整 (乘10^d、rint、再除)，再截断到[lower, upper]，NaN保持不变"""
+    value = np.rint(value * scale) / scale
+    if value < lower:
+        return lower
+    if value > upper:
+        return upper
+    return value
+
+
+# 显式签名: 导入时即完成编译 (cache=True时直接从磁盘缓存加载)，首个计算调用无JIT开销
+# 价格数组声明为只读，可写数组也能隐式匹配，故pandas返回的只读视图与普通数组共用同一签名
+if NUMBA_AVAILABLE:
+    _F8_1D_RO = types.Array(types.float64, 1, 'C', readonly=True)
+    _KDJ_ALL_SIGNATURES = [
+        types.void(_F8_1D_RO, _F8_1D_RO, _F8_1D_RO, types.int64, types.float64, types.float64,
+                   types.float64, types.Array(types.float64, 2, 'C'))
+    ]
+else:
+    _KDJ_ALL_SIGNATURES = []
+
+
+@njit(_KDJ_ALL_SIGNATURES, cache=True, error_model='numpy')
+def kdj_all(high, low, close, period, k0, d0, scale, out):
+    """
+    KDJ全流程单次遍历，out为(3, N)矩阵，依次写入取整截断后的K、D、J
+    滚动极值跳过NaN与±inf且min_periods=1，与pandas rolling一致；RSV非有限 (最高价等于最低价或价格缺失) 时取50
+    首日K、D取初值k0/d0 (首日RSV不参与递推)；仅一行数据时K、D均取该行RSV
+    """
+    n = close.shape[0]
+    ring_up = np.empty(period, dtype=np.int64)
+    ring_lo = np.empty(period, dtype=np.int64)
+    head_up = size_up = 0
+    head_lo = size_lo = 0
+    k = k0
+    d = d0
+    for i in range(n):
+        # 移除滑出窗口的队首
+        if size_up > 0 and ring_up[head_up] <= i - period:
+            head_up = (head_up + 1) % period
+            size_up -= 1
+        if size_lo > 0 and ring_lo[head_lo] <= i - period:
+            head_lo = (head_lo + 1) % period
+            size_lo -= 1
+
+        # 从队尾弹出不再可能成为极值的元素后入队
+        h = high[i]
+        if np.isfinite(h):
+            while size_up > 0 and high[ring_up[(head_up + size_up - 1) % period]] <= h:
+                size_up -= 1
+            ring_up[(head_up + size_up) % period] = i
+            size_up += 1
+        lo = low[i]
+        if np.isfinite(lo):
+            while size_lo > 0 and low[ring_lo[(head_lo + size_lo - 1) % period]] >= lo:
+                size_lo -= 1
+            ring_lo[(head_lo + size_lo) % period] = i
+            size_lo += 1
+
+        highest = high[ring_up[head_up]] if size_up > 0 else np.nan
+        lowest = low[ring_lo[head_lo]] if size_lo > 0 else np.nan
+        # error_model='numpy': 除零得到inf/NaN而非抛出异常，随后统一按非有限值处理
+        rsv = ((close[i] - lowest) / (highest - lowest)) * 100
+        if not np.isfinite(rsv):
+            rsv = 50.0
+
+        if n == 1:
+            k = d = rsv
+        elif i > 0:
+            k = (2.0 / 3.0) * k + (1.0 / 3.0) * rsv
+            d = (2.0 / 3.0) * d + (1.0 / 3.0) * k
+
+        out[0, i] = _round_clip(k, scale, -20.0, 120.0)
+        out[1, i] = _round_clip(d, scale, -20.0, 120.0)
+        out[2, i] = _round_clip(3 * k - 2 * d, scale, -50.0, 150.0)
@@ -3,12 +3,14 @@ KDJ配置管理模块
 处理参数验证、默认配置和因子元信息
 """
 
+from types import MappingProxyType
+
 
 class KdjConfig:
     """KDJ随机指标因子配置管理"""
 
-    # 默认参数 - 基于ETF优化的KDJ参数
-    DEFAULT_PARAMS = {"period": 9}
+    # 默认参数 - 基于ETF优化的KDJ参数 (只读，validate_params返回其普通dict副本，调用方可自由修改)
+    DEFAULT_PARAMS = MappingProxyType({"period": 9})
 
     # 所需数据列
     REQUIRED_COLUMNS = ['ts_code', 'trade_date', 'hfq_high', 'hfq_low', 'hfq_close']
@@ -20,7 +22,7 @@ class KdjConfig:
     @classmethod
     def validate_params(cls, params=None) -> dict:
         if params is None:
-            return cls.DEFAULT_PARAMS.copy()
+            return dict(cls.DEFAULT_PARAMS)
 
         if isinstance(params, dict):
             period = params.get("period", cls.DEFAULT_PARAMS["period"])
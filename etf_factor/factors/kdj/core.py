@@ -14,12 +14,21 @@ sys.path.insert(0, etf_factor_root)
 
 from src.base_factor import BaseFactor
 from src.config import config
+from src.numba_compat import NUMBA_AVAILABLE
+from src.bottleneck_compat import BOTTLENECK_AVAILABLE, move_max, move_min
 
 # 使用绝对路径导入避免模块名冲突
 import importlib.util
 
-# 导入KdjConfig
+# 导入计算内核
 current_dir = os.path.dirname(__file__)
+kernels_path = os.path.join(current_dir, '_kernels.py')
+spec = importlib.util.spec_from_file_location("kdj_kernels", kernels_path)
+kernels_module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(kernels_module)
+kdj_all = kernels_module.kdj_all
+
+# 导入KdjConfig
 config_path = os.path.join(current_dir, 'config.py')
 spec = importlib.util.spec_from_file_location("kdj_config", config_path)
 config_module = importlib.util.module_from_spec(spec)
@@ -27,12 +36,39 @@ spec.loader.exec_module(config_module)
 KdjConfig = config_module.KdjConfig
 
 
+# 精度为常量配置，导入时读取一次；内核使用与np.round相同的10^d取整因子
+_PRECISION = config.get_precision('indicator')
+_SCALE = 10.0 ** _PRECISION
+
+
+def _inf_to_nan(values: np.ndarray) -> np.ndarray:
+    """±inf替换为NaN，不含inf时原样返回 (不复制)"""
+    inf_mask = np.isinf(values)
+    if inf_mask.any():
+        values = values.copy()
+        values[inf_mask] = np.nan
+    return values
+
+
+def _rolling_extreme(values: np.ndarray, period: int, reduce) -> np.ndarray:
+    """
+    基于sliding_window_view的滚动极值 (reduce为np.fmax/np.fmin，跳过NaN)
+    前端补period-1个NaN，等价于pandas rolling(min_periods=1)；窗口全为缺失时为NaN
+    """
+    padded = np.concatenate((np.full(period - 1, np.nan), _inf_to_nan(values)))
+    windows = np.lib.stride_tricks.sliding_window_view(padded, period)
+    return reduce.reduce(windows, axis=1)
+
+
 class KDJ(BaseFactor):
     """KDJ随机指标因子 - 模块化实现"""
 
     def __init__(self, params=None):
         validated_params = KdjConfig.validate_params(params)
         super().__init__(validated_params)
+        # 输出列名与预期列集合只依赖参数，初始化时生成一次
+        self._k_col, self._d_col, self._j_col = KdjConfig.get_expected_output_columns(validated_params)
+        self._expected_columns = frozenset(('ts_code', 'trade_date', self._k_col, self._d_col, self._j_col))
 
     def calculate_vectorized(self, data: pd.DataFrame) -> pd.DataFrame:
         """
@@ -42,75 +78,75 @@ class KDJ(BaseFactor):
         D值 = 2/3 × 前一日D值 + 1/3 × 当日K值
         J值 = 3 × K值 - 2 × D值
         """
-        result = data[['ts_code', 'trade_date']].copy()
-
-        # 获取价格数据
-        high_prices = data['hfq_high']
-        low_prices = data['hfq_low']
-        close_prices = data['hfq_close']
+        # 获取价格数据，一次转为C连续的float64数组，后续计算全部在数组上完成
+        # (由二维数组构造的DataFrame其列可能是跨步视图，显式连续化后bottleneck与编译内核均按步长1顺序扫描)
+        high_prices = np.ascontiguousarray(data['hfq_high'].to_numpy(), dtype=np.float64)
+        low_prices = np.ascontiguousarray(data['hfq_low'].to_numpy(), dtype=np.float64)
+        close_prices = np.ascontiguousarray(data['hfq_close'].to_numpy(), dtype=np.float64)
 
         period = self.params["period"]
+        kdj_values = np.empty((3, len(data)))
 
-        # 计算N日内最高价和最低价
-        highest_high = high_prices.rolling(window=period, min_periods=1).max()
-        lowest_low = low_prices.rolling(window=period, min_periods=1).min()
-
-        # 计算RSV (Raw Stochastic Value)
-        rsv = ((close_prices - lowest_low) / (highest_high - lowest_low)) * 100
-
-        # 处理除零情况
-        rsv = rsv.fillna(50)  # 当最高价等于最低价时，RSV设为50
-        rsv = np.where(np.isinf(rsv), 50, rsv)
-
-        # 确保rsv是pandas Series，然后转为numpy数组
-        if isinstance(rsv, pd.Series):
-            rsv_array = rsv.values
+        if NUMBA_AVAILABLE:
+            # 编译内核一次遍历完成滚动极值、RSV、K/D递推、J值及取整截断
+            kdj_all(high_prices, low_prices, close_prices, period, 50.0, 50.0, _SCALE, kdj_values)
         else:
-            rsv_array = rsv
-
-        # 初始化K、D值
-        k_values = np.zeros(len(data))
-        d_values = np.zeros(len(data))
+            self._calculate_kdj_numpy(high_prices, low_prices, close_prices, period, kdj_values)
 
-        # KDJ的初始值通常设为50
-        k_values[0] = 50
-        d_values[0] = 50
+        # 三列以同一个二维float64块一次并入结果 (转置视图即pandas块布局，不复制)
+        kdj_frame = pd.DataFrame(kdj_values.T, index=data.index, copy=False,
+                                 columns=[self._k_col, self._d_col, self._j_col])
+        result = pd.concat([data[['ts_code', 'trade_date']], kdj_frame], axis=1)
 
-        # 逐步计算K、D值（使用指数移动平均的思想）
-        for i in range(1, len(data)):
-            # K = 2/3 * 前一日K + 1/3 * 当日RSV
-            k_values[i] = (2/3) * k_values[i-1] + (1/3) * rsv_array[i]
+        return result
 
-            # D = 2/3 * 前一日D + 1/3 * 当日K
-            d_values[i] = (2/3) * d_values[i-1] + (1/3) * k_values[i]
+    def _calculate_kdj_numpy(self, high_prices, low_prices, close_prices, period, out):
+        """KDJ的pandas/NumPy实现 (numba不可用时使用)，结果写入(3, N)矩阵out，与kdj_all一致"""
+        # 计算N日内最高价和最低价
+        if BOTTLENECK_AVAILABLE and len(close_prices) > 0:
+            # bottleneck滑动极值 (min_count=1对应min_periods=1)；窗口截断到数据长度，结果不变
+            # pandas rolling视±inf为缺失，bottleneck则将其计入极值，故先替换为NaN
+            window = min(period, len(close_prices))
+            highest_high = move_max(_inf_to_nan(high_prices), window=window, min_count=1)
+            lowest_low = move_min(_inf_to_nan(low_prices), window=window, min_count=1)
+        elif len(close_prices) > 0:
+            # 二维窗口视图上按行归约，替代pandas rolling的逐窗口极值
+            highest_high = _rolling_extreme(high_prices, period, np.fmax)
+            lowest_low = _rolling_extreme(low_prices, period, np.fmin)
+        else:
+            highest_high = lowest_low = close_prices
+
+        # 计算RSV (Raw Stochastic Value)，在同一数组上原地完成
+        # 最高价等于最低价 (0/0或x/0) 及价格缺失时结果非有限，统一设为50
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rsv = close_prices - lowest_low
+            rsv /= highest_high - lowest_low
+            rsv *= 100
+        rsv[~np.isfinite(rsv)] = 50
+
+        # K、D递推即α=1/3的指数平滑 (adjust=False)，交由ewm在C层完成
+        # 首日K、D固定为50: 以50替换首日RSV作为递推初值；K首日即为50，D直接对K平滑
+        rsv_seeded = pd.Series(rsv, copy=True)
+        rsv_seeded.iloc[0] = 50
+        k_series = rsv_seeded.ewm(alpha=1.0 / 3.0, adjust=False).mean()
+        d_series = k_series.ewm(alpha=1.0 / 3.0, adjust=False).mean()
+        k_values = k_series.to_numpy()
+        d_values = d_series.to_numpy()
 
         # 如果只有一行数据，使用RSV作为K值
-        if len(data) == 1:
-            k_values[0] = rsv_array[0]
-            d_values[0] = rsv_array[0]
+        if len(close_prices) == 1:
+            k_values = d_values = np.asarray(rsv, dtype=np.float64)
 
         # 计算J值
         j_values = 3 * k_values - 2 * d_values
 
-        # 应用精度配置
-        precision = config.get_precision('indicator')
-        result[f'KDJ_K_{period}'] = pd.Series(k_values).round(precision)
-        result[f'KDJ_D_{period}'] = pd.Series(d_values).round(precision)
-        result[f'KDJ_J_{period}'] = pd.Series(j_values).round(precision)
-
-        # 数据验证和清理
-        k_col = f'KDJ_K_{period}'
-        d_col = f'KDJ_D_{period}'
-        j_col = f'KDJ_J_{period}'
-
-        # K和D值通常在0-100之间，但可以适当超出
-        result[k_col] = result[k_col].clip(-20, 120)
-        result[d_col] = result[d_col].clip(-20, 120)
-
-        # J值可以超出0-100范围更多，这是正常的
-        result[j_col] = result[j_col].clip(-50, 150)
-
-        return result
+        # 应用精度配置并限制范围，取整结果直接写入out的对应行，再原地截断
+        # K和D值通常在0-100之间，但可以适当超出；J值可以超出0-100范围更多，这是正常的
+        for row, values, lower, upper in ((out[0], k_values, -20, 120),
+                                          (out[1], d_values, -20, 120),
+                                          (out[2], j_values, -50, 150)):
+            np.round(values, _PRECISION, out=row)
+            np.clip(row, lower, upper, out=row)
 
     def get_required_columns(self) -> list:
         return KdjConfig.get_required_columns()
@@ -120,22 +156,16 @@ class KDJ(BaseFactor):
 
     def validate_calculation_result(self, result: pd.DataFrame) -> bool:
         try:
-            expected_columns = ['ts_code', 'trade_date'] + KdjConfig.get_expected_output_columns(self.params)
-            if not all(col in result.columns for col in expected_columns):
+            if not self._expected_columns.issubset(result.columns):
                 return False
 
             if len(result) == 0:
                 return False
 
             # 检查KDJ值的合理性
-            period = self.params['period']
-            k_col = f'KDJ_K_{period}'
-            d_col = f'KDJ_D_{period}'
-            j_col = f'KDJ_J_{period}'
-
-            k_values = result[k_col].dropna()
-            d_values = result[d_col].dropna()
-            j_values = result[j_col].dropna()
+            k_values = result[self._k_col].dropna()
+            d_values = result[self._d_col].dropna()
+            j_values = result[self._j_col].dropna()
 
             if len(k_values) == 0 or len(d_values) == 0 or len(j_values) == 0:
                 return False
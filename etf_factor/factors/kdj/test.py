@@ -16,20 +16,29 @@ from core import KDJ
 from validation import KdjValidation
 
 
+def _make_ohlc(high, low, close) -> pd.DataFrame:
+    """由高/低/收价格数组一次构建单标的测试数据 (标的代码与DataLoader一致为category类型，交易日自2025-01-01起)"""
+    return pd.DataFrame({
+        'ts_code': pd.Categorical.from_codes(np.zeros(len(close), dtype=np.int8), categories=['510580.SH']),
+        'trade_date': pd.date_range('2025-01-01', periods=len(close)),
+        'hfq_high': np.asarray(high, dtype=np.float64),
+        'hfq_low': np.asarray(low, dtype=np.float64),
+        'hfq_close': np.asarray(close, dtype=np.float64)
+    })
+
+
 def test_kdj_basic():
     print("🧪 测试KDJ基础功能...")
 
     # 创建测试数据（模拟价格趋势变化）
-    test_data = pd.DataFrame({
-        'ts_code': ['510580.SH'] * 15,
-        'trade_date': pd.date_range('2025-01-01', periods=15),
-        'hfq_high': [10.5, 10.8, 10.2, 11.0, 10.1, 10.6, 11.2, 10.4, 10.9, 11.5,
-                     10.7, 11.3, 10.8, 10.5, 11.0],
-        'hfq_low': [10.0, 10.3, 9.8, 10.5, 9.6, 10.1, 10.7, 10.0, 10.4, 11.0,
-                    10.2, 10.8, 10.3, 10.0, 10.5],
-        'hfq_close': [10.3, 10.6, 10.0, 10.8, 9.8, 10.4, 11.0, 10.2, 10.7, 11.2,
-                      10.5, 11.1, 10.6, 10.3, 10.8]
-    })
+    test_data = _make_ohlc(
+        high=[10.5, 10.8, 10.2, 11.0, 10.1, 10.6, 11.2, 10.4, 10.9, 11.5,
+              10.7, 11.3, 10.8, 10.5, 11.0],
+        low=[10.0, 10.3, 9.8, 10.5, 9.6, 10.1, 10.7, 10.0, 10.4, 11.0,
+             10.2, 10.8, 10.3, 10.0, 10.5],
+        close=[10.3, 10.6, 10.0, 10.8, 9.8, 10.4, 11.0, 10.2, 10.7, 11.2,
+               10.5, 11.1, 10.6, 10.3, 10.8]
+    )
 
     factor = KDJ({"period": 9})
     result = factor.calculate_vectorized(test_data)
@@ -37,17 +46,15 @@ def test_kdj_basic():
     print(f"   输入数据: {len(test_data)} 行")
     print(f"   输出数据: {len(result)} 行")
     print(f"   输出列: {list(result.columns)}")
-    print(f"   KDJ_K_9样例: {result['KDJ_K_9'].iloc[-3:].tolist()}")
-    print(f"   KDJ_D_9样例: {result['KDJ_D_9'].iloc[-3:].tolist()}")
-    print(f"   KDJ_J_9样例: {result['KDJ_J_9'].iloc[-3:].tolist()}")
+    print(f"   KDJ_K_9样例: {result['KDJ_K_9'].to_numpy()[-3:].tolist()}")
+    print(f"   KDJ_D_9样例: {result['KDJ_D_9'].to_numpy()[-3:].tolist()}")
+    print(f"   KDJ_J_9样例: {result['KDJ_J_9'].to_numpy()[-3:].tolist()}")
 
     is_valid = factor.validate_calculation_result(result)
     print(f"   结果验证: {'✅ 通过' if is_valid else '❌ 失败'}")
 
     # 验证J值关系：J = 3*K - 2*D
-    latest_k = result['KDJ_K_9'].iloc[-1]
-    latest_d = result['KDJ_D_9'].iloc[-1]
-    latest_j = result['KDJ_J_9'].iloc[-1]
+    latest_k, latest_d, latest_j = result[['KDJ_K_9', 'KDJ_D_9', 'KDJ_J_9']].to_numpy()[-1]
     calculated_j = 3 * latest_k - 2 * latest_d
 
     print(f"   J值关系验证: J={latest_j:.2f}, 3K-2D={calculated_j:.2f}")
@@ -77,37 +84,25 @@ def test_kdj_validation():
     print("🧪 测试KDJ验证功能...")
 
     # 创建更长的随机数据用于统计验证
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     n_days = 30
     base_price = 100
 
-    # 生成有趋势的价格数据
-    prices_high = []
-    prices_low = []
-    prices_close = []
+    # 生成有趋势的价格数据：轻微上涨趋势 + 变化的波动率
+    day = np.arange(n_days)
+    base = base_price + 0.1 * day
+    volatility = 2 + 0.5 * np.sin(day * 0.2)
 
-    for i in range(n_days):
-        base = base_price + 0.1 * i  # 轻微上涨趋势
-        volatility = 2 + 0.5 * np.sin(i * 0.2)  # 变化的波动率
+    prices_high = base + np.abs(rng.normal(0, volatility))
+    prices_low = base - np.abs(rng.normal(0, volatility))
+    # 确保价格逻辑正确：收盘价位于最高价与最低价之间
+    prices_close = np.clip(base + rng.normal(0, volatility * 0.5), prices_low, prices_high)
 
-        daily_high = base + abs(np.random.normal(0, volatility))
-        daily_low = base - abs(np.random.normal(0, volatility))
-        daily_close = base + np.random.normal(0, volatility * 0.5)
-
-        # 确保价格逻辑正确
-        daily_close = max(min(daily_close, daily_high), daily_low)
-
-        prices_high.append(daily_high)
-        prices_low.append(daily_low)
-        prices_close.append(daily_close)
-
-    test_data = pd.DataFrame({
-        'ts_code': ['510580.SH'] * n_days,
-        'trade_date': pd.date_range('2025-01-01', periods=n_days),
-        'hfq_high': prices_high,
-        'hfq_low': prices_low,
-        'hfq_close': prices_close
-    })
+    test_data = _make_ohlc(
+        high=prices_high,
+        low=prices_low,
+        close=prices_close
+    )
 
     factor = KDJ()  # 使用默认参数
     result = factor.calculate_vectorized(test_data)
@@ -129,20 +124,16 @@ def test_kdj_edge_cases():
     print("🧪 测试KDJ边界情况...")
 
     # 测试恒定价格（无波动）
-    constant_data = pd.DataFrame({
-        'ts_code': ['510580.SH'] * 12,
-        'trade_date': pd.date_range('2025-01-01', periods=12),
-        'hfq_high': [10.0] * 12,
-        'hfq_low': [10.0] * 12,
-        'hfq_close': [10.0] * 12
-    })
+    constant_data = _make_ohlc(
+        high=np.full(12, 10.0),
+        low=np.full(12, 10.0),
+        close=np.full(12, 10.0)
+    )
 
     factor = KDJ()
     result_constant = factor.calculate_vectorized(constant_data)
 
-    latest_k_const = result_constant['KDJ_K_9'].iloc[-1]
-    latest_d_const = result_constant['KDJ_D_9'].iloc[-1]
-    latest_j_const = result_constant['KDJ_J_9'].iloc[-1]
+    latest_k_const, latest_d_const, latest_j_const = result_constant[['KDJ_K_9', 'KDJ_D_9', 'KDJ_J_9']].to_numpy()[-1]
 
     print(f"   恒定价格KDJ: K={latest_k_const:.1f}, D={latest_d_const:.1f}, J={latest_j_const:.1f}")
 
@@ -151,20 +142,16 @@ def test_kdj_edge_cases():
     print(f"   恒定价格检查: {'✅ 正确' if constant_check else '❌ 错误'} (K、D接近50)")
 
     # 测试极端波动数据
-    extreme_data = pd.DataFrame({
-        'ts_code': ['510580.SH'] * 15,
-        'trade_date': pd.date_range('2025-01-01', periods=15),
-        'hfq_high': [10, 12, 8, 15, 5, 18, 3, 20, 2, 25, 1, 30, 35, 40, 45],
-        'hfq_low': [9, 11, 7, 14, 4, 17, 2, 19, 1, 24, 0.5, 29, 34, 39, 44],
-        'hfq_close': [9.5, 11.5, 7.5, 14.5, 4.5, 17.5, 2.5, 19.5, 1.5, 24.5, 0.75, 29.5, 34.5, 39.5, 44.5]
-    })
+    extreme_data = _make_ohlc(
+        high=[10, 12, 8, 15, 5, 18, 3, 20, 2, 25, 1, 30, 35, 40, 45],
+        low=[9, 11, 7, 14, 4, 17, 2, 19, 1, 24, 0.5, 29, 34, 39, 44],
+        close=[9.5, 11.5, 7.5, 14.5, 4.5, 17.5, 2.5, 19.5, 1.5, 24.5, 0.75, 29.5, 34.5, 39.5, 44.5]
+    )
 
     try:
         result_extreme = factor.calculate_vectorized(extreme_data)
 
-        latest_k_ext = result_extreme['KDJ_K_9'].iloc[-1]
-        latest_d_ext = result_extreme['KDJ_D_9'].iloc[-1]
-        latest_j_ext = result_extreme['KDJ_J_9'].iloc[-1]
+        latest_k_ext, latest_d_ext, latest_j_ext = result_extreme[['KDJ_K_9', 'KDJ_D_9', 'KDJ_J_9']].to_numpy()[-1]
 
         print(f"   极端波动KDJ: K={latest_k_ext:.1f}, D={latest_d_ext:.1f}, J={latest_j_ext:.1f}")
 
@@ -174,24 +161,30 @@ def test_kdj_edge_cases():
 
         # 测试不同周期参数
         factor_short = KDJ({"period": 5})
-        result_short = factor_short.calculate_vectorized(test_data := pd.DataFrame({
-            'ts_code': ['510580.SH'] * 20,
-            'trade_date': pd.date_range('2025-01-01', periods=20),
-            'hfq_high': [10 + 0.5 * np.sin(i * 0.3) + 0.2 * i for i in range(20)],
-            'hfq_low': [9.5 + 0.4 * np.sin(i * 0.3) + 0.2 * i for i in range(20)],
-            'hfq_close': [9.75 + 0.45 * np.sin(i * 0.3) + 0.2 * i for i in range(20)]
-        }))
+        result_short = factor_short.calculate_vectorized(test_data := _make_ohlc(
+            high=10 + 0.5 * np.sin(np.arange(20) * 0.3) + 0.2 * np.arange(20),
+            low=9.5 + 0.4 * np.sin(np.arange(20) * 0.3) + 0.2 * np.arange(20),
+            close=9.75 + 0.45 * np.sin(np.arange(20) * 0.3) + 0.2 * np.arange(20)
+        ))
 
         factor_long = KDJ({"period": 14})
         result_long = factor_long.calculate_vectorized(test_data)
 
         # 不同周期的KDJ应该有不同的敏感性
-        k5 = result_short['KDJ_K_5'].iloc[-5:].std()
-        k14 = result_long['KDJ_K_14'].iloc[-5:].std()
+        k5 = np.std(result_short['KDJ_K_5'].to_numpy()[-5:], ddof=1)
+        k14 = np.std(result_long['KDJ_K_14'].to_numpy()[-5:], ddof=1)
 
         period_check = k5 >= k14  # 短周期通常比长周期更敏感
         print(f"   周期敏感性: K5波动={k5:.2f}, K14波动={k14:.2f} ({'✅ 符合预期' if period_check else '⚠️ 特殊情况'})")
 
+        # 测试非默认索引（筛选后的数据）：结果沿用输入索引，数值与重置索引后计算一致
+        subset = test_data.iloc[5:]
+        result_subset = factor_short.calculate_vectorized(subset)
+        result_reset = factor_short.calculate_vectorized(subset.reset_index(drop=True))
+        index_check = (result_subset.index.equals(subset.index) and
+                       np.array_equal(result_subset['KDJ_K_5'].to_numpy(), result_reset['KDJ_K_5'].to_numpy()))
+        print(f"   非默认索引: {'✅ 正确' if index_check else '❌ 错误'} (输出按行位置对齐)")
+
     except Exception as e:
         print(f"   边界测试失败: {e}")
 
@@ -203,13 +196,12 @@ def test_kdj_different_periods():
 
     # 创建具有明确趋势的测试数据
     n_days = 25
-    test_data = pd.DataFrame({
-        'ts_code': ['510580.SH'] * n_days,
-        'trade_date': pd.date_range('2025-01-01', periods=n_days),
-        'hfq_high': [50 + 2 * i + np.sin(i * 0.5) for i in range(n_days)],
-        'hfq_low': [49 + 2 * i + np.sin(i * 0.5) for i in range(n_days)],
-        'hfq_close': [49.5 + 2 * i + np.sin(i * 0.5) for i in range(n_days)]
-    })
+    trend = 2 * np.arange(n_days) + np.sin(np.arange(n_days) * 0.5)
+    test_data = _make_ohlc(
+        high=50 + trend,
+        low=49 + trend,
+        close=49.5 + trend
+    )
 
     periods_to_test = [5, 9, 14, 20]
     results = {}
@@ -245,23 +237,17 @@ def test_kdj_signal_analysis():
     print("🧪 测试KDJ信号分析...")
 
     # 创建包含买卖信号的测试数据
-    # 先上涨然后下跌的价格模式
-    prices = []
-    base = 100
-    for i in range(30):
-        if i < 15:  # 前15天上涨
-            price = base + 2 * i + np.random.normal(0, 0.5)
-        else:  # 后15天下跌
-            price = base + 30 - 1.5 * (i - 15) + np.random.normal(0, 0.5)
-        prices.append(price)
-
-    test_data = pd.DataFrame({
-        'ts_code': ['510580.SH'] * 30,
-        'trade_date': pd.date_range('2025-01-01', periods=30),
-        'hfq_high': [p + abs(np.random.normal(0, 0.5)) for p in prices],
-        'hfq_low': [p - abs(np.random.normal(0, 0.5)) for p in prices],
-        'hfq_close': prices
-    })
+    # 先上涨然后下跌的价格模式：前15天上涨，后15天下跌
+    rng = np.random.default_rng(7)
+    day = np.arange(30)
+    trend = np.where(day < 15, 100 + 2 * day, 130 - 1.5 * (day - 15))
+    prices = trend + rng.normal(0, 0.5, 30)
+
+    test_data = _make_ohlc(
+        high=prices + np.abs(rng.normal(0, 0.5, 30)),
+        low=prices - np.abs(rng.normal(0, 0.5, 30)),
+        close=prices
+    )
 
     factor = KDJ({"period": 9})
     result = factor.calculate_vectorized(test_data)
@@ -271,15 +257,11 @@ def test_kdj_signal_analysis():
     d_values = result['KDJ_D_9']
     j_values = result['KDJ_J_9']
 
-    # 找到金叉和死叉点
-    golden_crosses = []
-    death_crosses = []
-
-    for i in range(1, len(result)):
-        if k_values.iloc[i] > d_values.iloc[i] and k_values.iloc[i-1] <= d_values.iloc[i-1]:
-            golden_crosses.append(i)
-        elif k_values.iloc[i] < d_values.iloc[i] and k_values.iloc[i-1] >= d_values.iloc[i-1]:
-            death_crosses.append(i)
+    # 找到金叉和死叉点（当日与前一日的K、D大小关系整列比较）
+    k = k_values.to_numpy()
+    d = d_values.to_numpy()
+    golden_crosses = (np.flatnonzero((k[1:] > d[1:]) & (k[:-1] <= d[:-1])) + 1).tolist()
+    death_crosses = (np.flatnonzero((k[1:] < d[1:]) & (k[:-1] >= d[:-1])) + 1).tolist()
 
     print(f"   金叉点(K上穿D): {golden_crosses}")
     print(f"   死叉点(K下穿D): {death_crosses}")
@@ -292,9 +274,7 @@ def test_kdj_signal_analysis():
     print(f"   超卖区域(K<20): {oversold}次")
 
     # 最新的KDJ状态
-    latest_k = k_values.iloc[-1]
-    latest_d = d_values.iloc[-1]
-    latest_j = j_values.iloc[-1]
+    latest_k, latest_d, latest_j = k[-1], d[-1], j_values.to_numpy()[-1]
 
     print(f"   最新KDJ状态: K={latest_k:.1f}, D={latest_d:.1f}, J={latest_j:.1f}")
 
@@ -112,7 +112,7 @@ class KdjValidation:
             recent_period = min(period, len(data))
             recent_high = high_prices.tail(recent_period).max()
             recent_low = low_prices.tail(recent_period).min()
-            latest_close = close_prices.iloc[-1]
+            latest_close = close_prices.to_numpy()[-1]
 
             manual_rsv = ((latest_close - recent_low) / (recent_high - recent_low)) * 100 if recent_high != recent_low else 50
 
@@ -135,33 +135,30 @@ class KdjValidation:
         if k_col not in result.columns or d_col not in result.columns or j_col not in result.columns:
             return False, "缺少KDJ列"
 
-        # 获取有效数据
-        valid_data = result[[k_col, d_col, j_col]].dropna()
-        if len(valid_data) == 0:
+        # 获取有效数据: 三列一次取出为数组，剔除任一列缺失的行，后续统计均在数组上完成
+        kdj = result[[k_col, d_col, j_col]].to_numpy(dtype=np.float64)
+        kdj = kdj[~np.isnan(kdj).any(axis=1)]
+        if len(kdj) == 0:
             return False, "无有效KDJ数据"
 
-        k_values = valid_data[k_col]
-        d_values = valid_data[d_col]
-        j_values = valid_data[j_col]
+        k_values = kdj[:, 0]
+        d_values = kdj[:, 1]
+        j_values = kdj[:, 2]
 
         # 验证KDJ的基本特性
         # 1. K、D值应该相对平滑（D比K更平滑）
         if len(k_values) >= 3:
-            k_volatility = k_values.diff().abs().mean()
-            d_volatility = d_values.diff().abs().mean()
+            k_volatility = np.abs(np.diff(k_values)).mean()
+            d_volatility = np.abs(np.diff(d_values)).mean()
 
             # D值的波动性通常小于K值（因为D是K的移动平均）
             if d_volatility > k_volatility * 2:  # 允许一定的误差
                 return True, f"D值波动大于预期但在可接受范围: K波动={k_volatility:.2f}, D波动={d_volatility:.2f}"
 
         # 2. 验证J值的计算关系：J = 3*K - 2*D
-        if len(valid_data) > 0:
-            calculated_j = 3 * k_values - 2 * d_values
-            j_diff = (calculated_j - j_values).abs()
-            max_diff = j_diff.max()
-
-            if max_diff > 0.1:  # 允许小的数值误差
-                return False, f"J值计算关系不符: 最大误差={max_diff:.4f}"
+        max_diff = np.abs(3 * k_values - 2 * d_values - j_values).max()
+        if max_diff > 0.1:  # 允许小的数值误差
+            return False, f"J值计算关系不符: 最大误差={max_diff:.4f}"
 
         # 3. 验证KDJ的统计特性
         k_mean = k_values.mean()
@@ -191,11 +188,11 @@ class KdjValidation:
             return True, f"D值出现极值但已被裁剪: 范围=[{d_min:.1f}, {d_max:.1f}]"
 
         # 5. 验证KDJ的趋势一致性
-        if len(valid_data) >= 5:
+        if len(kdj) >= 5:
             # 检查K、D、J的趋势方向
-            k_trend = (k_values.iloc[-1] - k_values.iloc[-5]) / 5
-            d_trend = (d_values.iloc[-1] - d_values.iloc[-5]) / 5
-            j_trend = (j_values.iloc[-1] - j_values.iloc[-5]) / 5
+            k_trend = (k_values[-1] - k_values[-5]) / 5
+            d_trend = (d_values[-1] - d_values[-5]) / 5
+            j_trend = (j_values[-1] - j_values[-5]) / 5
 
             # 如果趋势方向完全相反，可能有问题
             if (k_trend > 0 and d_trend < -abs(k_trend)) or (k_trend < 0 and d_trend > abs(k_trend)):
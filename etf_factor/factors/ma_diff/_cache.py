@@ -0,0 +1,85 @@
+"""
+MA_DIFF均线缓存
+同一份收盘价序列在多个差值对/多次调用间复用各周期均线 (如(5,10)与(5,20)共用MA_5)
+键为价格内容摘要+周期，数据被原地修改后摘要随之变化，不会命中过期结果
+"""
+
+import numpy as np
+
+from src.array_cache import ArrayCache, digest
+
+_cache = ArrayCache()
+
+# 前缀和分块长度：块内重新累加，误差只随块长而非序列长度增长 (不小于最长窗口，窗口至多跨两块)
+_BLOCK = 1024
+
+
+def _prefix_sums(values: np.ndarray, block: int) -> tuple:
+    """
+    滚动均值所需的分块前缀和 (有效值个数、块内有效值之和、各块总和)，各周期共用
+    NaN与±inf按pandas rolling规则视为缺失；以首个有效值为基准平移，降低相减误差
+    """
+    valid = np.isfinite(values)
+    base = values[valid.argmax()] if valid.any() else 0.0
+    count = np.concatenate(([0], np.cumsum(valid)))
+
+    # 按块补零后逐块累加，local[k]为k所在块起点至k(不含)之和
+    n_blocks = len(values) // block + 1
+    shifted = np.zeros(n_blocks * block)
+    np.subtract(values, base, out=shifted[:len(values)], where=valid)
+    blocks = np.cumsum(shifted.reshape(n_blocks, block), axis=1)
+    local = np.zeros_like(blocks)
+    local[:, 1:] = blocks[:, :-1]
+    return count, local.ravel(), blocks[:, -1], base, block
+
+
+def _rolling_mean(count: np.ndarray, local: np.ndarray, block_total: np.ndarray,
+                  base: float, block: int, window: int) -> np.ndarray:
+    """基于分块前缀和的滚动均值 (min_periods=1)，O(n)复杂度，与窗口长度无关；窗口内无有效值时为NaN"""
+    end = np.arange(1, len(count))
+    start = np.maximum(end - window, 0)
+    start_block = start // block
+
+    # 窗口跨块时由起点所在块的剩余部分与终点块内前缀拼接
+    total = local[end] - local[start]
+    crossed = end // block != start_block
+    total[crossed] += block_total[start_block[crossed]]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = total / (count[end] - count[start])
+    mean += base
+    return mean
+
+
+def cached_moving_averages(values: np.ndarray, periods) -> dict:
+    """
+    带LRU缓存的多周期滚动均值，结果与输入同dtype (前缀和固定为float64)
+    分块累加的结果与pandas rolling均值相差在1e-9量级，取整到6位小数后极少数行可能相差末位1
+    单条均线超出缓存容量时 (如长面板数据) 直接计算，不计算摘要
+
+    Returns:
+        {周期: 均线数组}，来自缓存的数组只读，调用方需要修改时应先复制
+    """
+    cacheable = _cache.fits(values.nbytes)
+    values_digest = digest(values) if cacheable else None
+    prefix = None
+    averages = {}
+    for period in periods:
+        key = (values_digest, values.dtype.str, len(values), period)
+        cached = _cache.get(key) if cacheable else None
+        if cached is not None:
+            ma, = cached
+        else:
+            # 仅在有未命中的周期时计算一次前缀和
+            if prefix is None:
+                prefix = _prefix_sums(values, max(_BLOCK, max(periods)))
+            ma = _rolling_mean(*prefix, period).astype(values.dtype, copy=False)
+            if cacheable:
+                _cache.put(key, (ma,))
+        averages[period] = ma
+    return averages
+
+
+def clear_cache() -> None:
+    """清空缓存"""
+    _cache.clear()
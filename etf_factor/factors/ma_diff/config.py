@@ -3,6 +3,8 @@ MA_DIFF配置管理模块
 处理参数验证、默认配置和因子元信息
 """
 
+import numpy as np
+
 
 class MaDiffConfig:
     """移动均线差值因子配置管理"""
@@ -11,7 +13,7 @@ class MaDiffConfig:
     DEFAULT_PARAMS = {"pairs": [(5, 10), (5, 20), (10, 20), (10, 60)]}
 
     # 所需数据列
-    REQUIRED_COLUMNS = ['ts_code', 'trade_date', 'hfq_close']
+    REQUIRED_COLUMNS = ('ts_code', 'trade_date', 'hfq_close')
 
     # 支持的参数范围
     MIN_PERIOD = 2
@@ -38,6 +40,25 @@ class MaDiffConfig:
         if not isinstance(pairs, list) or len(pairs) == 0:
             raise ValueError("pairs必须是非空列表")
 
+        # 整体转为(N, 2)整数矩阵后以数组比较一次完成范围与大小关系检查；
+        # 转换失败或存在非法pair时交由逐个检查给出与原先一致的错误信息
+        if all(isinstance(pair, (tuple, list)) and len(pair) == 2 for pair in pairs):
+            try:
+                arr = np.asarray(pairs, dtype=np.int64)
+            except (ValueError, TypeError, OverflowError):
+                arr = None
+            if arr is not None and arr.shape == (len(pairs), 2):
+                in_range = (arr >= cls.MIN_PERIOD) & (arr <= cls.MAX_PERIOD)
+                if in_range.all() and (arr[:, 0] < arr[:, 1]).all():
+                    # 去重（保持首次出现的顺序）
+                    _, first_index = np.unique(arr, axis=0, return_index=True)
+                    return [tuple(pair) for pair in arr[np.sort(first_index)].tolist()]
+
+        return cls._validate_pairs_sequential(pairs)
+
+    @classmethod
+    def _validate_pairs_sequential(cls, pairs) -> list:
+        """逐个pair检查并转换，遇到第一个非法pair即抛出对应错误"""
         validated = []
         for pair in pairs:
             if not isinstance(pair, (tuple, list)) or len(pair) != 2:
@@ -88,8 +109,8 @@ class MaDiffConfig:
         return unique_pairs
 
     @classmethod
-    def get_required_columns(cls) -> list:
-        return cls.REQUIRED_COLUMNS.copy()
+    def get_required_columns(cls) -> tuple:
+        return cls.REQUIRED_COLUMNS
 
     @classmethod
     def get_factor_info(cls, params: dict) -> dict:
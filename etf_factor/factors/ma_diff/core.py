@@ -5,26 +5,15 @@ MA_DIFF核心计算模块
 
 import pandas as pd
 import numpy as np
-import sys
-import os
-
-# 添加正确的项目路径
-etf_factor_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-sys.path.insert(0, etf_factor_root)
 
 from src.base_factor import BaseFactor
 from src.config import config
 
-# 使用绝对路径导入避免模块名冲突
-import importlib.util
+from ._cache import cached_moving_averages
+from .config import MaDiffConfig
 
-# 导入MaDiffConfig
-current_dir = os.path.dirname(__file__)
-config_path = os.path.join(current_dir, 'config.py')
-spec = importlib.util.spec_from_file_location("ma_diff_config", config_path)
-config_module = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(config_module)
-MaDiffConfig = config_module.MaDiffConfig
+# 均线与差值的计算/存储精度，配置开启时使用float32减半内存带宽 (前缀和固定为float64)
+_DTYPE = np.float32 if config.get('calculation.float32_ma_diff', False) else np.float64
 
 
 class MA_DIFF(BaseFactor):
@@ -33,78 +22,63 @@ class MA_DIFF(BaseFactor):
     def __init__(self, params=None):
         validated_params = MaDiffConfig.validate_params(params)
         super().__init__(validated_params)
+        # 输出列名、预期列集合与因子信息只依赖参数，初始化时生成一次
+        self._output_columns = MaDiffConfig.get_expected_output_columns(validated_params)
+        self._expected_columns = frozenset(('ts_code', 'trade_date', *self._output_columns))
+        self._factor_info = MaDiffConfig.get_factor_info(validated_params)
 
     def calculate_vectorized(self, data: pd.DataFrame) -> pd.DataFrame:
         """
         向量化计算移动均线差值
         MA_DIFF = 短周期MA - 长周期MA
         """
-        result = data[['ts_code', 'trade_date']].copy()
-
-        close_prices = data['hfq_close']
-
-        # 预计算所有需要的MA值
-        ma_cache = {}
-        all_periods = set()
-        for short, long in self.params["pairs"]:
-            all_periods.add(short)
-            all_periods.add(long)
-
-        # 向量化计算所有需要的MA
-        for period in all_periods:
-            ma_values = close_prices.rolling(window=period, min_periods=1).mean()
-            ma_cache[period] = ma_values
-
-        # 计算所有差值对
-        for short, long in self.params["pairs"]:
-            column_name = f"MA_DIFF_{short}_{long}"
-
+        close_prices = data['hfq_close'].to_numpy(dtype=_DTYPE)
+
+        # 预计算所有需要的MA值: 前缀和只算一次，各周期的MA由前缀和相减得到
+        # 相同价格与周期的均线在差值对及调用间缓存复用
+        pairs = self.params["pairs"]
+        all_periods = {period for pair in pairs for period in pair}
+        ma_cache = cached_moving_averages(close_prices, all_periods)
+
+        # 计算所有差值对: 每个差值对占(差值对数, N)矩阵的一行，相减、取整、无穷值置NaN均在该行上原地完成
+        # (MA差值可以为负数，使用更宽松的验证)
+        precision = config.get_precision("price")
+        diff_block = np.empty((len(pairs), len(close_prices)), dtype=_DTYPE)
+        for diff_values, (short, long) in zip(diff_block, pairs):
             # 计算差值：短周期MA - 长周期MA
-            diff_values = ma_cache[short] - ma_cache[long]
+            np.subtract(ma_cache[short], ma_cache[long], out=diff_values)
 
             # 应用全局精度配置
-            precision = config.get_precision("price")
-            diff_values = diff_values.round(precision)
-
-            result[column_name] = diff_values
+            np.round(diff_values, precision, out=diff_values)
+            diff_values[np.isinf(diff_values)] = np.nan
 
-        # 数据验证和清理
-        numeric_columns = [col for col in result.columns if col.startswith("MA_DIFF_")]
-        for col in numeric_columns:
-            # MA差值可以为负数，使用更宽松的验证
-            result[col] = result[col].replace([float("inf"), -float("inf")], pd.NA)
+        # 全部差值列以同一个二维块一次并入结果 (转置视图即pandas块布局，不复制)
+        diff_frame = pd.DataFrame(diff_block.T, index=data.index, copy=False, columns=self._output_columns)
+        result = pd.concat([data[['ts_code', 'trade_date']], diff_frame], axis=1)
 
         return result
 
-    def get_required_columns(self) -> list:
+    def get_required_columns(self) -> tuple:
         return MaDiffConfig.get_required_columns()
 
     def get_factor_info(self) -> dict:
-        return MaDiffConfig.get_factor_info(self.params)
+        return self._factor_info
 
     def validate_calculation_result(self, result: pd.DataFrame) -> bool:
         try:
-            expected_columns = ['ts_code', 'trade_date'] + MaDiffConfig.get_expected_output_columns(self.params)
-            if not all(col in result.columns for col in expected_columns):
+            if not self._expected_columns.issubset(result.columns):
                 return False
 
             if len(result) == 0:
                 return False
 
             # 检查MA_DIFF值的合理性
-            for short, long in self.params["pairs"]:
-                col_name = f"MA_DIFF_{short}_{long}"
-                diff_values = result[col_name].dropna()
-
-                if len(diff_values) == 0:
-                    continue
-
-                # MA差值应在合理范围内（可以为负）
-                if (abs(diff_values) > 1000).any():
-                    return False
+            for col_name in self._output_columns:
+                # 绝对值的最大值一次归约 (fmax跳过NaN，全为NaN时结果为NaN，视为数据不足而通过)
+                largest = np.fmax.reduce(np.abs(result[col_name].to_numpy(dtype=np.float64)))
 
-                # 检查是否有无穷大值
-                if np.isinf(diff_values).any():
+                # MA差值应在合理范围内（可以为负），无穷大值同样超出范围
+                if largest > 1000:
                     return False
 
             return True
@@ -1,19 +1,13 @@
 """
 MA_DIFF测试模块
 独立的测试和示例功能
+运行方式 (etf_factor目录下): python -m factors.ma_diff.test
 """
 
 import pandas as pd
 import numpy as np
-import sys
-import os
-
-# 添加路径以导入因子
-current_dir = os.path.dirname(__file__)
-sys.path.insert(0, current_dir)
-
-from core import MA_DIFF
-from validation import MaDiffValidation
+from .core import MA_DIFF
+from .validation import MaDiffValidation
 
 
 def test_madiff_basic():
@@ -115,6 +109,27 @@ def test_madiff_edge_cases():
 
     print(f"   恒定价格MA_DIFF: {'✅ 全为零' if all_zero else '❌ 存在非零值'}")
 
+    # 测试长序列大幅漂移的价格：与pandas rolling均值之差在取整误差内一致
+    n_long = 200_000
+    drift_close = np.linspace(1, 3000, n_long) * (1 + np.random.default_rng(9).normal(0, 0.01, n_long))
+    drift_data = pd.DataFrame({
+        'ts_code': '510580.SH',
+        'trade_date': pd.date_range('2000-01-01', periods=n_long),
+        'hfq_close': drift_close
+    })
+    result_drift = factor.calculate_vectorized(drift_data)
+    rolling_means = {period: pd.Series(drift_close).rolling(period, min_periods=1).mean()
+                     for pair in factor.params['pairs'] for period in pair}
+    # 输出按价格精度取整，允许取整误差；分块前缀和与pandas的累加顺序不同，末位相差1的行应极少
+    # (不分块的整段前缀和在该数据上约有0.15%的行末位不同)
+    drift_check = True
+    for short, long in factor.params['pairs']:
+        expected = rolling_means[short] - rolling_means[long]
+        actual = result_drift[f'MA_DIFF_{short}_{long}']
+        mismatched = (actual != expected.round(6)).sum()
+        drift_check &= np.allclose(actual, expected, rtol=0, atol=1e-6) and mismatched <= n_long // 10000
+    print(f"   长序列漂移检查: {'✅ 正确' if drift_check else '❌ 错误'} (与pandas rolling在取整误差内一致)")
+
     # 测试极端波动数据
     volatile_data = pd.DataFrame({
         'ts_code': ['510580.SH'] * 30,
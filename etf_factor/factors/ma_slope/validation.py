@@ -5,6 +5,7 @@ MA_SLOPE数据验证模块
 
 import pandas as pd
 import numpy as np
+import warnings
 
 # 使用绝对路径导入避免模块名冲突
 import importlib.util
@@ -53,7 +54,6 @@ class MaSlopeValidator:
         max_period = max(self.params['periods'])
         min_required_length = max_period * 2  # 需要足够数据来计算斜率
         if len(data) < min_required_length:
-            import warnings
             warnings.warn(f"数据长度({len(data)})小于建议最小长度({min_required_length})，部分结果可能为空")
 
         # 检查收盘价数据
@@ -80,7 +80,6 @@ class MaSlopeValidator:
         # 检查连续性（不应有过多的空值）
         null_ratio = prices.isnull().sum() / len(prices)
         if null_ratio > 0.3:  # 30%以上为空值
-            import warnings
             warnings.warn(f"价格数据空值比例过高({null_ratio:.1%})，可能影响MA斜率计算准确性")
 
     def _validate_date_data(self, dates: pd.Series) -> None:
@@ -161,19 +160,16 @@ class MaSlopeValidator:
             # 检查零值比例（如果斜率经常为0，可能表示价格趋势平缓）
             zero_ratio = (non_null_slope.abs() < 0.001).sum() / len(non_null_slope)
             if zero_ratio > 0.8:  # 80%以上接近零值
-                import warnings
                 warnings.warn(f"周期{period}的MA斜率接近零值比例过高({zero_ratio:.1%})，可能表示趋势不明显")
 
             # 检查标准差的合理性
             slope_std = non_null_slope.std()
             if slope_std > 5:  # 标准差超过5可能表示斜率波动过大
-                import warnings
                 warnings.warn(f"周期{period}的MA斜率标准差过大({slope_std:.2f})，请检查数据质量")
 
             # 检查异常高斜率的比例
             high_slope_ratio = (non_null_slope.abs() > 2).sum() / len(non_null_slope)  # 绝对值大于2的斜率
             if high_slope_ratio > 0.2:  # 20%以上的数据点有高斜率
-                import warnings
                 warnings.warn(f"周期{period}的MA斜率中高斜率数据点较多({high_slope_ratio:.1%})，请检查数据质量")
 
         return True
\ No newline at end of file
@@ -5,6 +5,7 @@ MACD数据验证模块
 
 import pandas as pd
 import numpy as np
+import warnings
 
 # 使用绝对路径导入避免模块名冲突
 import importlib.util
@@ -53,7 +54,6 @@ class MacdValidator:
         max_period = max(self.params['slow_period'], self.params['fast_period'], self.params['signal_period'])
         min_required_length = max_period + self.params['signal_period']  # MACD需要足够数据来计算信号线
         if len(data) < min_required_length:
-            import warnings
             warnings.warn(f"数据长度({len(data)})小于建议最小长度({min_required_length})，MACD结果可能不稳定")
 
         # 检查收盘价数据
@@ -80,7 +80,6 @@ class MacdValidator:
         # 检查连续性（不应有过多的空值）
         null_ratio = prices.isnull().sum() / len(prices)
         if null_ratio > 0.3:  # 30%以上为空值
-            import warnings
             warnings.warn(f"价格数据空值比例过高({null_ratio:.1%})，可能影响MACD计算准确性")
 
         # 检查价格序列的有效性
@@ -89,7 +88,6 @@ class MacdValidator:
             price_changes = non_null_prices.pct_change().dropna()
             extreme_changes = (price_changes.abs() > 0.5).sum()  # 50%以上变化
             if extreme_changes > len(price_changes) * 0.1:  # 10%以上的点有极端变化
-                import warnings
                 warnings.warn(f"价格数据存在较多极端变化({extreme_changes}个)，可能影响MACD准确性")
 
     def _validate_date_data(self, dates: pd.Series) -> None:
@@ -173,7 +171,6 @@ class MacdValidator:
             # 检查是否有过多的零值（可能表示计算错误）
             zero_ratio = (non_null_values.abs() < 0.001).sum() / len(non_null_values)
             if zero_ratio > 0.9:  # 90%以上接近零值
-                import warnings
                 warnings.warn(f"{component_name}接近零值比例过高({zero_ratio:.1%})，可能表示计算异常")
 
             # 检查MACD组件的波动合理性
@@ -183,11 +180,9 @@ class MacdValidator:
             # MACD_HIST通常比DIF和DEA波动更大
             if component_name == 'MACD_HIST':
                 if values_std > 50:  # HIST标准差过大
-                    import warnings
                     warnings.warn(f"{component_name}标准差过大({values_std:.2f})，请检查数据质量")
             else:  # DIF 和 DEA
                 if values_std > 20:  # DIF/DEA标准差过大
-                    import warnings
                     warnings.warn(f"{component_name}标准差过大({values_std:.2f})，请检查数据质量")
 
         return True
@@ -221,7 +216,6 @@ class MacdValidator:
             invalid_ratio = (hist_diff > tolerance).sum() / len(hist_diff)
 
             if invalid_ratio > 0.05:  # 5%以上的数据点关系不正确
-                import warnings
                 warnings.warn(f"MACD组件关系验证失败，{invalid_ratio:.1%}的数据点HIST≠DIF-DEA")
                 return False
 
@@ -232,7 +226,6 @@ class MacdValidator:
 
                 # DEA作为DIF的EMA，通常应该比DIF更平滑
                 if dea_volatility > dif_volatility * 1.5:  # DEA波动显著大于DIF
-                    import warnings
                     warnings.warn("DEA波动性异常，可能存在计算问题")
 
             return True
@@ -43,6 +43,8 @@ class MAX_DD(BaseFactor):
 
         close_prices = data['hfq_close']
 
+        precision = config.get_precision('percentage')
+
         # 计算各周期的最大回撤
         for period in self.params["periods"]:
             column_name = f'MAX_DD_{period}'
@@ -72,17 +74,16 @@ class MAX_DD(BaseFactor):
             ).apply(calculate_max_drawdown, raw=True)
 
             # 应用精度配置
-            precision = config.get_precision('percentage')
             max_dd_values = max_dd_values.round(precision)
 
             result[column_name] = max_dd_values
 
         # 数据清理
+        # 全部回撤列作为一个float64块处理，无穷值与负值 (最大回撤应为正数) 以布尔掩码置NaN
         numeric_columns = [col for col in result.columns if col.startswith('MAX_DD_')]
-        for col in numeric_columns:
-            result[col] = result[col].replace([float('inf'), -float('inf')], pd.NA)
-            # 最大回撤应为正数
-            result[col] = result[col].where(result[col] >= 0)
+        block = result[numeric_columns].to_numpy(dtype=np.float64, copy=True)
+        block[np.isinf(block) | (block < 0)] = np.nan
+        result[numeric_columns] = block
 
         return result
 
@@ -5,6 +5,7 @@ MOM数据验证模块
 
 import pandas as pd
 import numpy as np
+import warnings
 
 # 使用绝对路径导入避免模块名冲突
 import importlib.util
@@ -52,7 +53,6 @@ class MomValidator:
         # 检查数据长度是否足够
         max_period = max(self.params['periods'])
         if len(data) < max_period + 1:
-            import warnings
             warnings.warn(f"数据长度({len(data)})小于最大计算周期+1({max_period+1})，部分结果可能为空")
 
         # 检查收盘价数据
@@ -79,7 +79,6 @@ class MomValidator:
         # 检查连续性（不应有过多的空值）
         null_ratio = prices.isnull().sum() / len(prices)
         if null_ratio > 0.3:  # 30%以上为空值
-            import warnings
             warnings.warn(f"价格数据空值比例过高({null_ratio:.1%})，可能影响动量计算准确性")
 
     def _validate_date_data(self, dates: pd.Series) -> None:
@@ -168,13 +167,11 @@ class MomValidator:
             # 动量值的标准差不应过大
             mom_std = non_null_mom.std()
             if mom_std > 50:  # 标准差超过50可能表示数据异常
-                import warnings
                 warnings.warn(f"周期{period}的动量指标标准差过大({mom_std:.2f})，请检查数据质量")
 
             # 检查零值比例（如果动量经常为0，可能表示价格没有变化）
             zero_ratio = (non_null_mom == 0).sum() / len(non_null_mom)
             if zero_ratio > 0.8:  # 80%以上为零值
-                import warnings
                 warnings.warn(f"周期{period}的动量指标零值比例过高({zero_ratio:.1%})，可能表示价格缺乏变化")
 
         return True
\ No newline at end of file
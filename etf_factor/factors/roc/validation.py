@@ -5,6 +5,7 @@ ROC数据验证模块
 
 import pandas as pd
 import numpy as np
+import warnings
 
 # 使用绝对路径导入避免模块名冲突
 import importlib.util
@@ -52,7 +53,6 @@ class RocValidator:
         # 检查数据长度是否足够
         max_period = max(self.params['periods'])
         if len(data) < max_period + 1:
-            import warnings
             warnings.warn(f"数据长度({len(data)})小于最大计算周期+1({max_period+1})，部分结果可能为空")
 
         # 检查收盘价数据
@@ -79,7 +79,6 @@ class RocValidator:
         # 检查连续性（不应有过多的空值）
         null_ratio = prices.isnull().sum() / len(prices)
         if null_ratio > 0.3:  # 30%以上为空值
-            import warnings
             warnings.warn(f"价格数据空值比例过高({null_ratio:.1%})，可能影响ROC计算准确性")
 
     def _validate_date_data(self, dates: pd.Series) -> None:
@@ -161,19 +160,16 @@ class RocValidator:
             # 检查零值比例（如果ROC经常为0，可能表示价格没有变化）
             zero_ratio = (non_null_roc == 0).sum() / len(non_null_roc)
             if zero_ratio > 0.8:  # 80%以上为零值
-                import warnings
                 warnings.warn(f"周期{period}的ROC零值比例过高({zero_ratio:.1%})，可能表示价格缺乏变化")
 
             # 检查标准差的合理性
             roc_std = non_null_roc.std()
             if roc_std > 200:  # 标准差超过200%可能表示数据异常
-                import warnings
                 warnings.warn(f"周期{period}的ROC标准差过大({roc_std:.1f}%)，请检查数据质量")
 
             # 检查异常高变动率的比例
             high_roc_ratio = (non_null_roc.abs() > 50).sum() / len(non_null_roc)  # 50%以上变动率
             if high_roc_ratio > 0.2:  # 20%以上的数据点有高变动率
-                import warnings
                 warnings.warn(f"周期{period}的ROC中高变动率数据点较多({high_roc_ratio:.1%})，请检查数据质量")
 
         return True
\ No newline at end of file
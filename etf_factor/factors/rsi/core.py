@@ -7,7 +7,7 @@ import pandas as pd
 import numpy as np
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from src.base_factor import BaseFactor
 from src.config import config
@@ -41,6 +41,8 @@ class RSI(BaseFactor):
         gains = price_change.where(price_change > 0, 0)
         losses = -price_change.where(price_change < 0, 0)
         
+        precision = config.get_precision('indicator')
+
         for period in self.params["periods"]:
             column_name = f'RSI_{period}'
             
@@ -50,7 +52,7 @@ class RSI(BaseFactor):
             rs = avg_gains / avg_losses
             rsi_values = 100 - (100 / (1 + rs))
             rsi_values = rsi_values.fillna(50)
-            rsi_values = rsi_values.round(config.get_precision('indicator'))
+            rsi_values = rsi_values.round(precision)
             
             result[column_name] = rsi_values
         
@@ -44,6 +44,8 @@ class SMA(BaseFactor):
         # 获取收盘价数据
         close_prices = data['hfq_close']
 
+        precision = config.get_precision('price')
+
         # 向量化计算所有周期的SMA
         for period in self.params["periods"]:
             column_name = f'SMA_{period}'
@@ -55,7 +57,7 @@ class SMA(BaseFactor):
             ).mean()
 
             # 应用全局精度配置
-            sma_values = sma_values.round(config.get_precision('price'))
+            sma_values = sma_values.round(precision)
 
             result[column_name] = sma_values
 
@@ -5,6 +5,7 @@ TR数据验证模块
 
 import pandas as pd
 import numpy as np
+import warnings
 
 # 使用绝对路径导入避免模块名冲突
 import importlib.util
@@ -51,7 +52,6 @@ class TrValidator:
 
         # 检查数据长度
         if len(data) < 2:
-            import warnings
             warnings.warn(f"数据长度({len(data)})少于2行，第一行TR结果将为NaN（缺少前一日收盘价）")
 
         # 检查OHLC数据
@@ -83,7 +83,6 @@ class TrValidator:
             # 检查连续性（不应有过多的空值）
             null_ratio = prices.isnull().sum() / len(prices)
             if null_ratio > 0.3:  # 30%以上为空值
-                import warnings
                 warnings.warn(f"{col}数据空值比例过高({null_ratio:.1%})，可能影响TR计算准确性")
 
         # 检查OHLC逻辑关系
@@ -108,7 +107,6 @@ class TrValidator:
         invalid_close_low = valid_data['hfq_close'] < valid_data['hfq_low']
 
         if invalid_close_high.any() or invalid_close_low.any():
-            import warnings
             warnings.warn("发现收盘价超出当日高低价范围的数据，可能影响TR计算")
 
     def _validate_date_data(self, dates: pd.Series) -> None:
@@ -186,13 +184,11 @@ class TrValidator:
             # 检查零值比例（如果TR经常为0，可能表示价格无波动）
             zero_ratio = (non_null_tr == 0).sum() / len(non_null_tr)
             if zero_ratio > 0.5:  # 50%以上为零值
-                import warnings
                 warnings.warn(f"TR零值比例过高({zero_ratio:.1%})，可能表示价格缺乏波动")
 
             # 检查标准差的合理性
             tr_std = non_null_tr.std()
             if tr_std > 100:  # 标准差超过100可能表示数据异常波动
-                import warnings
                 warnings.warn(f"TR标准差过大({tr_std:.2f})，请检查数据质量")
 
         return True
\ No newline at end of file
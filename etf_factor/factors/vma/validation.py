@@ -5,6 +5,7 @@ VMA数据验证模块
 
 import pandas as pd
 import numpy as np
+import warnings
 
 # 使用绝对路径导入避免模块名冲突
 import importlib.util
@@ -52,7 +53,6 @@ class VmaValidator:
         # 检查数据长度是否足够
         max_period = max(self.params['periods'])
         if len(data) < max_period:
-            import warnings
             warnings.warn(f"数据长度({len(data)})小于最大计算周期({max_period})，部分结果可能不准确")
 
         # 检查成交量数据
@@ -79,7 +79,6 @@ class VmaValidator:
         # 检查成交量数据连续性
         null_ratio = volume.isnull().sum() / len(volume)
         if null_ratio > 0.3:  # 30%以上为空值
-            import warnings
             warnings.warn(f"成交量数据空值比例过高({null_ratio:.1%})，可能影响VMA计算准确性")
 
         # 检查成交量数据分布合理性
@@ -87,7 +86,6 @@ class VmaValidator:
             # 检查是否有过多零值（可能表示停牌或数据问题）
             zero_ratio = (non_null_volume == 0).sum() / len(non_null_volume)
             if zero_ratio > 0.5:  # 50%以上为零值
-                import warnings
                 warnings.warn(f"成交量零值比例过高({zero_ratio:.1%})，可能影响分析有效性")
 
             # 检查成交量波动性
@@ -96,7 +94,6 @@ class VmaValidator:
             if volume_mean > 0:
                 cv = volume_std / volume_mean  # 变异系数
                 if cv > 10:  # 变异系数过大
-                    import warnings
                     warnings.warn(f"成交量变异系数过大({cv:.2f})，数据波动性异常")
 
     def _validate_date_data(self, dates: pd.Series) -> None:
@@ -171,7 +168,6 @@ class VmaValidator:
             # 检查零值比例
             zero_ratio = (non_null_vma == 0).sum() / len(non_null_vma)
             if zero_ratio > 0.8:  # 80%以上为零值
-                import warnings
                 warnings.warn(f"周期{period}的VMA零值比例过高({zero_ratio:.1%})，可能表示成交量长期为零")
 
             # 检查VMA的变异系数
@@ -180,7 +176,6 @@ class VmaValidator:
             if vma_mean > 0:
                 cv = vma_std / vma_mean
                 if cv > 15:  # 变异系数过大
-                    import warnings
                     warnings.warn(f"周期{period}的VMA变异系数过大({cv:.2f})，请检查数据质量")
 
             # 检查VMA数值范围合理性
@@ -190,7 +185,6 @@ class VmaValidator:
 
             # 如果最大值是最小值的10000倍以上，可能有异常
             if vma_min > 0 and vma_max / vma_min > 10000:
-                import warnings
                 warnings.warn(f"周期{period}的VMA数值范围过大(最大值/最小值={vma_max/vma_min:.0f})，请检查数据")
 
         return True
\ No newline at end of file
@@ -45,6 +45,8 @@ class WMA(BaseFactor):
         # 获取收盘价数据
         close_prices = data['hfq_close']
 
+        precision = config.get_precision('price')
+
         # 向量化计算所有周期的WMA
         for period in self.params["periods"]:
             column_name = f'WMA_{period}'
@@ -71,7 +73,7 @@ class WMA(BaseFactor):
             ).apply(calculate_wma_single, raw=True)
 
             # 应用全局精度配置
-            wma_values = wma_values.round(config.get_precision('price'))
+            wma_values = wma_values.round(precision)
 
             result[column_name] = wma_values
 
@@ -0,0 +1,80 @@
+"""
+Array Cache - 进程内的中间数组缓存
+键由调用方以数组内容摘要构造，总字节数超过上限时按最近最少使用淘汰
+读写在同一把锁内完成，可在线程池中并发调用；存入的数组置为只读，命中时直接返回不复制
+文件限制: <100行
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from .config import config
+
+
+def digest(values: np.ndarray) -> bytes:
+    """数组内容摘要 (blake2b直接读取缓冲区，不复制数据)"""
+    return hashlib.blake2b(np.ascontiguousarray(values), digest_size=16).digest()
+
+
+class ArrayCache:
+    """按总字节数限制容量的LRU数组缓存 (线程安全)"""
+
+    def __init__(self, max_bytes: int = None):
+        """
+        Args:
+            max_bytes: 缓存数组的总字节数上限，默认取cache_settings.array_cache_mb，0为关闭缓存
+        """
+        if max_bytes is None:
+            max_bytes = int(config.get('cache_settings.array_cache_mb', 64) * 1024 * 1024)
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def fits(self, nbytes: int) -> bool:
+        """大小为nbytes的结果能否放入缓存；放不下时调用方直接计算，无需计算摘要"""
+        return 0 < nbytes <= self.max_bytes
+
+    def get(self, key):
+        """取出缓存的数组元组，未命中返回None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, arrays: tuple) -> None:
+        """存入一组数组 (置为只读)，总字节数超过上限时淘汰最久未使用的条目"""
+        nbytes = sum(array.nbytes for array in arrays)
+        if not self.fits(nbytes):
+            return
+        for array in arrays:
+            array.flags.writeable = False
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._nbytes -= previous[1]
+            self._entries[key] = (arrays, nbytes)
+            self._nbytes += nbytes
+            while self._nbytes > self.max_bytes:
+                _, (_, evicted_nbytes) = self._entries.popitem(last=False)
+                self._nbytes -= evicted_nbytes
+
+    @property
+    def nbytes(self) -> int:
+        """当前缓存数组的总字节数"""
+        return self._nbytes
+
+    def clear(self) -> None:
+        """清空缓存"""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+
+__all__ = ["ArrayCache", "digest"]
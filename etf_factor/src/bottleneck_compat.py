@@ -0,0 +1,16 @@
+"""
+Bottleneck Compat - 可选的Bottleneck归约加速
+bottleneck未安装时归约函数回退到NumPy同名函数；滑动窗口函数无NumPy对应实现，需据BOTTLENECK_AVAILABLE判断
+文件限制: <50行
+"""
+
+try:
+    from bottleneck import nanmean, nanstd, move_max, move_min
+    BOTTLENECK_AVAILABLE = True
+except ImportError:
+    from numpy import nanmean, nanstd
+    move_max = move_min = None
+    BOTTLENECK_AVAILABLE = False
+
+
+__all__ = ["nanmean", "nanstd", "move_max", "move_min", "BOTTLENECK_AVAILABLE"]
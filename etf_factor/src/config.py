@@ -6,6 +6,7 @@ Global Configuration Manager - 全局配置管理器
 
 import os
 import yaml
+import numpy as np
 import pandas as pd
 from typing import Dict, Any, Optional
 from pathlib import Path
@@ -161,24 +162,44 @@ class GlobalConfig:
         template_key = f"naming_convention.{file_type}_template"
         return self.get(template_key, "{name}_{symbol}.csv")
     
-    def validate_data_range(self, data: pd.Series, data_type: str) -> pd.Series:
+    def get_data_range(self, data_type: str) -> tuple:
         """
-        验证数据范围
+        获取数据有效范围
         Args:
-            data: 数据序列
             data_type: 数据类型 (price, volume, percentage)
         Returns:
-            验证后的数据 (异常值设为NaN)
+            (最小值, 最大值)，未配置的边界为None
         """
         if data_type not in ['price', 'volume', 'percentage']:
-            return data
+            return None, None
         
         range_config = self.get(f"validation.{data_type}_range")
         if not range_config:
+            return None, None
+        
+        return range_config.get('min'), range_config.get('max')
+    
+    def validate_data_range(self, data, data_type: str):
+        """
+        验证数据范围
+        Args:
+            data: 数据序列 (pd.Series，或浮点ndarray)
+            data_type: 数据类型 (price, volume, percentage)
+        Returns:
+            验证后的数据 (异常值设为NaN)，类型与输入相同
+        """
+        min_val, max_val = self.get_data_range(data_type)
+        if min_val is None and max_val is None:
             return data
         
-        min_val = range_config.get('min')
-        max_val = range_config.get('max')
+        # 浮点ndarray快速路径: NaN参与比较恒为False，无需额外的非空掩码
+        if isinstance(data, np.ndarray) and data.dtype.kind == 'f':
+            validated = data.copy()
+            if min_val is not None:
+                validated[validated < min_val] = np.nan
+            if max_val is not None:
+                validated[validated > max_val] = np.nan
+            return validated
         
         validated_data = data.copy()
         
@@ -10,6 +10,9 @@ import numpy as np
 from typing import Optional, Union, List
 import hashlib
 
+# 价格字段后缀 (如hfq_close、qfq_high)，加载时统一转换为float64
+_PRICE_FIELDS = frozenset(('open', 'high', 'low', 'close'))
+
 
 class DataLoader:
     """数据加载和预处理器"""
@@ -69,9 +72,17 @@ class DataLoader:
         # 日期处理
         data['trade_date'] = pd.to_datetime(data['trade_date'], format='%Y%m%d')
         
+        # 代码列使用分类类型 (整数编码+少量类别)，降低复制和分组开销
+        data['ts_code'] = data['ts_code'].astype('category')
+        
         # 按日期排序
         data = data.sort_values('trade_date').reset_index(drop=True)
         
+        # 价格列在入口统一为float64，因子中to_numpy(dtype=np.float64)直接得到视图而无需逐次转换
+        for col in data.columns:
+            if col.rsplit('_', 1)[-1] in _PRICE_FIELDS:
+                data[col] = pd.to_numeric(data[col], errors='coerce').astype(np.float64, copy=False)
+
         # 数值列转换
         numeric_cols = data.select_dtypes(include=[np.number]).columns
         for col in numeric_cols:
@@ -0,0 +1,31 @@
+"""
+Numba Compat - 可选的Numba JIT加速
+numba未安装时提供同名的无操作替代，因子模块据NUMBA_AVAILABLE选择计算路径
+配置calculation.jit_kernels为false时不导入numba，各因子走pandas/NumPy预编译路径 (无导入与首次JIT编译开销)
+文件限制: <50行
+"""
+
+from .config import config
+
+NUMBA_AVAILABLE = False
+if config.get('calculation.jit_kernels', True):
+    try:
+        from numba import njit, prange
+        NUMBA_AVAILABLE = True
+    except ImportError:
+        pass
+
+if not NUMBA_AVAILABLE:
+    prange = range
+
+    def njit(*args, **kwargs):
+        """无操作装饰器 - 保持函数为纯Python实现，仅用于让内核定义可导入"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
+
+
+__all__ = ["njit", "prange", "NUMBA_AVAILABLE"]
@@ -0,0 +1,21 @@
+"""
+Numba Kernels - 各因子编译内核共用的标量辅助函数
+numba未安装时经numba_compat退化为普通Python函数，语义不变
+文件限制: <50行
+"""
+
+import numpy as np
+
+from .numba_compat import njit
+
+
+@njit(cache=True)
+def finalize(value, scale, range_min, range_max):
+    """与np.round(x, decimals)相同的取整 (乘10^d、rint、再除)，非有限值与超出范围的值记为NaN"""
+    value = np.rint(value * scale) / scale
+    if not np.isfinite(value) or value < range_min or value > range_max:
+        return np.nan
+    return value
+
+
+__all__ = ["finalize"]